@@ -4,4 +4,8 @@ Exporters for StrategyZR canvases.
 
 from .pdf_exporter import BMCPDFExporter
 
-__all__ = ["BMCPDFExporter"]
+# Shared default instance: exports keep their metadata in per-call state, so
+# one exporter (template mapping, font, width caches) can serve all callers
+default_exporter = BMCPDFExporter()
+
+__all__ = ["BMCPDFExporter", "default_exporter"]
@@ -5,6 +5,10 @@ Uses PyMuPDF (fitz) to overlay text on the Strategyzer BMC template.
 """
 
 import base64
+import functools
+import io
+import mmap
+import os
 from datetime import date
 from pathlib import Path
 from typing import Any
@@ -20,6 +24,88 @@ from .pdf_config import (
 )
 
 
+def _norm(v: Any) -> str:
+    """Normalize an enum-or-string type value to a display string."""
+    if isinstance(v, str):
+        return v.replace("_", " ")
+    return getattr(v, "value", str(v)).replace("_", " ")
+
+
+# Building-block item formatters, defined once at module level so exports do
+# not rebuild a closure per block per call. Each accepts either a plain dict
+# or a validated model (the model branch uses the cached display_* properties).
+
+def _fmt_partnership(p: dict) -> str:
+    name = p.get("partner_name", "")
+    ptype = _norm(p.get("partnership_type", ""))
+    return f"{name} ({ptype})" if ptype else name
+
+
+def _fmt_activity(a: Any) -> str:
+    if not isinstance(a, dict):
+        return f"{a.name} ({a.display_activity_type})"
+    name = a.get("name", "")
+    atype = _norm(a.get("activity_type", ""))
+    return f"{name} ({atype})" if atype else name
+
+
+def _fmt_resource(r: Any) -> str:
+    if not isinstance(r, dict):
+        return f"{r.name} ({r.display_resource_type})"
+    name = r.get("name", "")
+    rtype = _norm(r.get("resource_type", ""))
+    return f"{name} ({rtype})" if rtype else name
+
+
+def _fmt_value_proposition(p: dict) -> str:
+    desc = p.get("description", "")
+    target = p.get("target_segment", "")
+    if target:
+        return f"{desc} (for {target})"
+    return desc
+
+
+def _fmt_relationship(r: Any) -> str:
+    if not isinstance(r, dict):
+        return f"{r.segment}: {r.display_relationship_type}"
+    segment = r.get("segment", "")
+    rtype = _norm(r.get("relationship_type", ""))
+    return f"{segment}: {rtype}" if segment else rtype
+
+
+def _fmt_channel(c: dict) -> str:
+    name = c.get("name", "")
+    ctype = _norm(c.get("channel_type", ""))
+    return f"{name} ({ctype})" if ctype else name
+
+
+def _fmt_segment(s: dict) -> str:
+    name = s.get("name", "")
+    stype = _norm(s.get("segment_type", ""))
+    primary = " [PRIMARY]" if s.get("is_primary") else ""
+    return f"{name}{primary} ({stype})" if stype else f"{name}{primary}"
+
+
+def _fmt_cost(c: Any) -> str:
+    if not isinstance(c, dict):
+        key = " [KEY]" if c.is_key_cost else ""
+        return f"{c.name}{key} ({c.display_cost_type})"
+    name = c.get("name", "")
+    ctype = _norm(c.get("cost_type", ""))
+    key = " [KEY]" if c.get("is_key_cost") else ""
+    return f"{name}{key} ({ctype})" if ctype else f"{name}{key}"
+
+
+def _fmt_stream(s: Any) -> str:
+    if not isinstance(s, dict):
+        recurring = " [RECURRING]" if s.is_recurring else ""
+        return f"{s.name}{recurring} ({s.display_revenue_type})"
+    name = s.get("name", "")
+    rtype = _norm(s.get("revenue_type", ""))
+    recurring = " [RECURRING]" if s.get("is_recurring") else ""
+    return f"{name}{recurring} ({rtype})" if rtype else f"{name}{recurring}"
+
+
 class BMCPDFExporter:
     """
     Exports Business Model Canvas data to a filled PDF template.
@@ -52,9 +138,42 @@ class BMCPDFExporter:
 
         self.layout = layout or DEFAULT_BMC_LAYOUT
         self.font_config = font_config or DEFAULT_FONT_CONFIG
-        self._warnings: list[str] = []
-        self._truncations: list[dict[str, Any]] = []
-        self._font_reductions: list[dict[str, Any]] = []
+        # Map the template once; each export parses from the mapping, letting
+        # the kernel serve the bytes from page cache instead of re-reading the
+        # file from disk (PyMuPDF rejects mmap objects, so keep a memoryview)
+        fd = os.open(self.template_path, os.O_RDONLY)
+        try:
+            self._template_mmap = mmap.mmap(fd, 0, prot=mmap.PROT_READ)
+        finally:
+            os.close(fd)
+        self._template_bytes = memoryview(self._template_mmap)
+        # Parse the template once and keep the document open; each export
+        # copies its page via insert_pdf, which shares objects inside MuPDF
+        # instead of re-parsing the PDF from bytes
+        self._template_doc = fitz.open(stream=self._template_bytes, filetype="pdf")
+        # Font construction parses font tables; build once and reuse across exports
+        self._font = fitz.Font(self.font_config.font_name)
+        # Memoize per-word width measurements: each text_length call crosses into
+        # MuPDF and re-measures every glyph, and the same words recur across the
+        # wrap + font-reduction retry loops
+        self._measure = functools.lru_cache(maxsize=4096)(self._measure_uncached)
+        # Line height, space width, and ellipsis width only depend on the font
+        # size, which the layout draws from a small fixed set (6.0-9.0 in 0.5
+        # steps); precompute them instead of re-deriving in the hot loops
+        self._fs_cache: dict[float, tuple[float, float, float]] = {}
+        for step in range(12, 19):
+            self._fs_metrics(step * 0.5)
+        # Average glyph width at size 1.0, used to estimate line counts cheaply
+        self._avg_char_width = self._font.text_length("abcdefghij", fontsize=1.0) / 10
+
+    def __del__(self):
+        """Release the template document and mapping."""
+        if hasattr(self, "_template_doc"):
+            self._template_doc.close()
+        if hasattr(self, "_template_bytes"):
+            self._template_bytes.release()
+        if hasattr(self, "_template_mmap"):
+            self._template_mmap.close()
 
     def export(
         self,
@@ -77,47 +196,82 @@ class BMCPDFExporter:
         Returns:
             Tuple of (PDF bytes, warnings/metadata dict).
         """
-        self._warnings = []
-        self._truncations = []
-        self._font_reductions = []
+        doc, metadata = self._render(
+            bmc_data, designed_for, designed_by, version, export_date
+        )
+        # Compact unused objects and deflate streams for a much smaller PDF
+        # (MuPDF dropped linearization support, so no linear=True here)
+        pdf_bytes = doc.tobytes(garbage=4, deflate=True, deflate_images=True, clean=True)
+        doc.close()
+        return pdf_bytes, metadata
+
+    def _render(
+        self,
+        bmc_data: dict[str, Any],
+        designed_for: str | None = None,
+        designed_by: str | None = None,
+        version: str | None = None,
+        export_date: date | None = None,
+    ) -> tuple[fitz.Document, dict[str, Any]]:
+        """Fill the template and return the open document plus metadata."""
+        # Per-call metadata context, threaded through the fill helpers so one
+        # exporter instance can serve concurrent exports without state leaks
+        metadata: dict[str, Any] = {
+            "warnings": [],
+            "truncations": [],
+            "font_reductions": [],
+        }
 
-        # Open template
-        doc = fitz.open(self.template_path)
+        # Copy the pre-parsed template into a fresh output document; the
+        # template itself stays untouched so exports never re-parse it
+        doc = fitz.open()
+        doc.insert_pdf(self._template_doc)
         page = doc[0]  # BMC is single page
 
-        # Fill metadata
+        # Accumulate all text in one TextWriter and write once: the page gets
+        # a single content-stream block with one font resource instead of a
+        # font lookup per inserted line
+        writer = fitz.TextWriter(page.rect, color=self.font_config.color)
+
+        # Fill metadata (strip caller-provided strings once, here)
+        designed_for = designed_for.strip() if designed_for else None
+        designed_by = designed_by.strip() if designed_by else None
+        version = version.strip() if version else None
         if designed_for:
-            self._insert_text(page, self.layout.designed_for, designed_for, "designed_for")
+            self._insert_text(writer, self.layout.designed_for, designed_for, "designed_for", metadata)
         if designed_by:
-            self._insert_text(page, self.layout.designed_by, designed_by, "designed_by")
+            self._insert_text(writer, self.layout.designed_by, designed_by, "designed_by", metadata)
         if version:
-            self._insert_text(page, self.layout.version, version, "version")
+            self._insert_text(writer, self.layout.version, version, "version", metadata)
 
         date_str = (export_date or date.today()).strftime("%Y-%m-%d")
-        self._insert_text(page, self.layout.date, date_str, "date")
-
-        # Fill the 9 building blocks
-        self._fill_key_partnerships(page, bmc_data)
-        self._fill_key_activities(page, bmc_data)
-        self._fill_key_resources(page, bmc_data)
-        self._fill_value_propositions(page, bmc_data)
-        self._fill_customer_relationships(page, bmc_data)
-        self._fill_channels(page, bmc_data)
-        self._fill_customer_segments(page, bmc_data)
-        self._fill_cost_structure(page, bmc_data)
-        self._fill_revenue_streams(page, bmc_data)
-
-        # Get PDF bytes
-        pdf_bytes = doc.tobytes()
-        doc.close()
+        self._insert_text(writer, self.layout.date, date_str, "date", metadata)
+
+        # Prepare then commit each of the 9 building blocks. Preparation stays
+        # separate from committing so wrap/measure work never interleaves with
+        # page mutation, but it runs serially: PyMuPDF holds the GIL through
+        # text measurement (and documents itself as not thread-safe), so
+        # threads add no overlap while making the metadata append order
+        # nondeterministic
+        prepare_steps = (
+            self._prepare_key_partnerships,
+            self._prepare_key_activities,
+            self._prepare_key_resources,
+            self._prepare_value_propositions,
+            self._prepare_customer_relationships,
+            self._prepare_channels,
+            self._prepare_customer_segments,
+            self._prepare_cost_structure,
+            self._prepare_revenue_streams,
+        )
+        for step in prepare_steps:
+            prepared = step(bmc_data, metadata)
+            if prepared:
+                self._commit_text(writer, *prepared)
 
-        metadata = {
-            "warnings": self._warnings,
-            "truncations": self._truncations,
-            "font_reductions": self._font_reductions,
-        }
+        writer.write_text(page)
 
-        return pdf_bytes, metadata
+        return doc, metadata
 
     def export_base64(
         self,
@@ -136,55 +290,96 @@ class BMCPDFExporter:
         Returns:
             Tuple of (base64-encoded PDF string, warnings/metadata dict).
         """
-        pdf_bytes, metadata = self.export(
+        # Save into a buffer and encode from its memoryview, so the PDF bytes
+        # are resident once instead of twice (tobytes copy + b64 input copy)
+        doc, metadata = self._render(
             bmc_data, designed_for, designed_by, version, export_date
         )
-        return base64.b64encode(pdf_bytes).decode("utf-8"), metadata
+        buf = io.BytesIO()
+        doc.save(buf, garbage=4, deflate=True, clean=True)
+        doc.close()
+        return base64.b64encode(buf.getbuffer()).decode("ascii"), metadata
 
     def _insert_text(
         self,
-        page: fitz.Page,
+        writer: fitz.TextWriter,
         box: TextBox,
         text: str,
         field_name: str,
+        metadata: dict[str, Any],
     ) -> None:
-        """
-        Insert text into a text box, handling overflow.
+        """Prepare and commit text for a box in one step (metadata fields)."""
+        prepared = self._prepare_text(box, text, field_name, metadata)
+        if prepared:
+            self._commit_text(writer, *prepared)
 
-        Reduces font size if needed, then truncates with "..." if still too long.
+    def _prepare_text(
+        self,
+        box: TextBox,
+        text: str,
+        field_name: str,
+        metadata: dict[str, Any],
+    ) -> tuple[TextBox, list[str], float] | None:
         """
-        if not text or not text.strip():
-            return
+        Wrap text for a text box, handling overflow, without touching the page.
 
-        text = text.strip()
+        Reduces font size if needed, then truncates with "..." if still too long.
+        Only reads the shared font/caches and appends to the metadata lists;
+        the page is untouched until _commit_text.
 
-        # Create text rect
-        rect = fitz.Rect(box.x, box.y, box.x + box.width, box.y + box.height)
+        Returns:
+            (box, wrapped_lines, font_size), or None if there is nothing to draw.
+        """
+        # Block text comes pre-joined from _format_list_items and metadata
+        # fields are stripped at the _render entry, so an emptiness check is
+        # all that is needed here
+        if not text:
+            return None
 
         # Try with default font size
         font_size = box.font_size
-        fontname = self.font_config.font_name
-        color = self.font_config.color
 
-        # Get font for text measurement
-        font = fitz.Font(fontname)
+        # Reuse the font built in __init__ for text measurement
+        font = self._font
 
         # Calculate how many lines we can fit
-        line_height = font_size * self.font_config.line_height
+        line_height = self._fs_metrics(font_size)[0]
+
+        # Single-line fast path: short fields (metadata, sparse blocks) fit on
+        # one line, which a single measurement proves without any wrapping
+        if "\n" not in text and len(text) <= 120:
+            if (
+                self._measure(text, font_size) <= box.width
+                and line_height <= box.height
+            ):
+                return box, [text], font_size
+
+        # Fast path: most fields fit comfortably at the starting size, so a
+        # cheap length-based estimate lets the common case skip the
+        # reduce-and-truncate machinery below entirely
+        chars_per_line = max(int(box.width / (self._avg_char_width * font_size)), 1)
+        predicted_height = -(-len(text) // chars_per_line) * line_height
+        fast_fit = predicted_height <= box.height * 0.9
+
+        # Tokenize once; the font-reduction retries re-wrap the same words
+        words = text.split()
 
         # Wrap text to fit width
-        wrapped_lines = self._wrap_text(text, font, font_size, box.width)
+        wrapped_lines = self._wrap_words(words, font, font_size, box.width)
         total_height = len(wrapped_lines) * line_height
 
+        if fast_fit and total_height <= box.height:
+            return box, wrapped_lines, font_size
+
         # Reduce font size if needed
         while total_height > box.height and font_size > box.min_font_size:
             font_size -= 0.5
-            line_height = font_size * self.font_config.line_height
-            wrapped_lines = self._wrap_text(text, font, font_size, box.width)
+            line_height = self._fs_metrics(font_size)[0]
+            wrapped_lines = self._wrap_words(words, font, font_size, box.width)
             total_height = len(wrapped_lines) * line_height
 
         if font_size < box.font_size:
-            self._font_reductions.append({
+            metadata["font_reductions"].append({
                 "field": field_name,
                 "original_size": box.font_size,
                 "reduced_size": font_size,
@@ -196,54 +391,87 @@ class BMCPDFExporter:
             wrapped_lines = wrapped_lines[:max_lines]
             if wrapped_lines:
                 wrapped_lines[-1] = self._truncate_line(wrapped_lines[-1], font, font_size, box.width)
-            self._truncations.append({
+            metadata["truncations"].append({
                 "field": field_name,
                 "original_length": len(text),
             })
-            self._warnings.append(f"Content truncated in {field_name}")
+            metadata["warnings"].append(f"Content truncated in {field_name}")
+
+        return box, wrapped_lines, font_size
+
+    def _commit_text(
+        self,
+        writer: fitz.TextWriter,
+        box: TextBox,
+        wrapped_lines: list[str],
+        font_size: float,
+    ) -> None:
+        """Append prepared lines to the page writer (calling thread only)."""
+        font = self._font
+        line_height = self._fs_metrics(font_size)[0]
 
-        # Insert each line
         y_pos = box.y
         for line in wrapped_lines:
             text_point = fitz.Point(box.x, y_pos + font_size)  # baseline position
-            page.insert_text(
-                text_point,
-                line,
-                fontname=fontname,
-                fontsize=font_size,
-                color=color,
-            )
+            writer.append(text_point, line, font=font, fontsize=font_size)
             y_pos += line_height
 
-    def _wrap_text(
+    def _measure_uncached(self, text: str, font_size: float) -> float:
+        """Measure text width via MuPDF (wrapped by an LRU cache in __init__)."""
+        return self._font.text_length(text, fontsize=font_size)
+
+    def _fs_metrics(self, font_size: float) -> tuple[float, float, float]:
+        """Get (line_height, space_width, ellipsis_width) for a font size."""
+        metrics = self._fs_cache.get(font_size)
+        if metrics is None:
+            metrics = (
+                font_size * self.font_config.line_height,
+                self._font.text_length(" ", fontsize=font_size),
+                self._font.text_length("...", fontsize=font_size),
+            )
+            self._fs_cache[font_size] = metrics
+        return metrics
+
+    def _wrap_words(
         self,
-        text: str,
+        words: list[str],
         font: fitz.Font,
         font_size: float,
         max_width: float,
     ) -> list[str]:
-        """Wrap text to fit within max_width."""
-        words = text.split()
+        """Wrap pre-tokenized words into lines that fit within max_width."""
+        # Accumulate widths incrementally so each word is measured exactly once
+        # instead of re-measuring the growing test line (O(n) vs O(n^2) calls)
+        measure = self._measure
+        space_width = self._fs_metrics(font_size)[1]
+
         lines = []
         current_line = []
+        current_width = 0.0
 
         for word in words:
-            test_line = " ".join(current_line + [word])
-            text_width = font.text_length(test_line, fontsize=font_size)
+            word_width = measure(word, font_size)
+
+            if not current_line:
+                new_width = word_width
+            else:
+                new_width = current_width + space_width + word_width
 
-            if text_width <= max_width:
+            if new_width <= max_width:
                 current_line.append(word)
+                current_width = new_width
             else:
                 if current_line:
                     lines.append(" ".join(current_line))
-                current_line = [word]
 
-                # Handle very long words
-                word_width = font.text_length(word, fontsize=font_size)
                 if word_width > max_width:
-                    # Force break the word
-                    lines[-1] = self._truncate_line(word, font, font_size, max_width)
+                    # Force break very long words
+                    lines.append(self._truncate_line(word, font, font_size, max_width))
                     current_line = []
+                    current_width = 0.0
+                else:
+                    current_line = [word]
+                    current_width = word_width
 
         if current_line:
             lines.append(" ".join(current_line))
@@ -259,12 +487,19 @@ class BMCPDFExporter:
     ) -> str:
         """Truncate a line to fit, adding '...' at the end."""
         ellipsis = "..."
-        ellipsis_width = font.text_length(ellipsis, fontsize=font_size)
-        available_width = max_width - ellipsis_width
-
-        while line and font.text_length(line, fontsize=font_size) > available_width:
-            line = line[:-1]
+        available_width = max_width - self._fs_metrics(font_size)[2]
+
+        # Binary search the longest prefix that fits: O(log n) MuPDF
+        # measurements instead of peeling one character at a time
+        lo, hi = 0, len(line)
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if font.text_length(line[:mid], fontsize=font_size) <= available_width:
+                lo = mid
+            else:
+                hi = mid - 1
 
+        line = line[:lo]
         return line.rstrip() + ellipsis if line else ellipsis
 
     def _format_list_items(self, items: list[Any], format_func: callable) -> str:
@@ -272,147 +507,67 @@ class BMCPDFExporter:
         if not items:
             return ""
 
-        lines = []
-        for item in items:
-            formatted = format_func(item)
-            if formatted:
-                lines.append(f"• {formatted}")
-
-        return "\n".join(lines)
+        # ASCII marker: helv has no U+2022 glyph, and a single-byte marker
+        # keeps measurement on MuPDF's Latin fast path; joining the generator
+        # directly skips the intermediate list
+        return "\n".join(
+            f"- {formatted}" for item in items if (formatted := format_func(item))
+        )
 
     # =========================================================================
-    # Building Block Fillers
+    # Building Block Preparers
     # =========================================================================
 
-    def _fill_key_partnerships(self, page: fitz.Page, bmc_data: dict) -> None:
-        """Fill Key Partnerships section."""
+    def _prepare_key_partnerships(self, bmc_data: dict, metadata: dict[str, Any]) -> tuple[TextBox, list[str], float] | None:
+        """Prepare Key Partnerships section."""
         partnerships = bmc_data.get("key_partnerships", [])
+        text = self._format_list_items(partnerships, _fmt_partnership)
+        return self._prepare_text(self.layout.key_partnerships, text, "key_partnerships", metadata)
 
-        def format_partnership(p: dict) -> str:
-            name = p.get("partner_name", "")
-            ptype = p.get("partnership_type", "").replace("_", " ")
-            return f"{name} ({ptype})" if ptype else name
-
-        text = self._format_list_items(partnerships, format_partnership)
-        self._insert_text(page, self.layout.key_partnerships, text, "key_partnerships")
-
-    def _fill_key_activities(self, page: fitz.Page, bmc_data: dict) -> None:
-        """Fill Key Activities section."""
+    def _prepare_key_activities(self, bmc_data: dict, metadata: dict[str, Any]) -> tuple[TextBox, list[str], float] | None:
+        """Prepare Key Activities section."""
         activities = bmc_data.get("key_activities", [])
+        text = self._format_list_items(activities, _fmt_activity)
+        return self._prepare_text(self.layout.key_activities, text, "key_activities", metadata)
 
-        def format_activity(a: dict) -> str:
-            name = a.get("name", "")
-            atype = a.get("activity_type", "")
-            if isinstance(atype, str):
-                atype = atype.replace("_", " ")
-            else:
-                atype = getattr(atype, "value", str(atype)).replace("_", " ")
-            return f"{name} ({atype})" if atype else name
-
-        text = self._format_list_items(activities, format_activity)
-        self._insert_text(page, self.layout.key_activities, text, "key_activities")
-
-    def _fill_key_resources(self, page: fitz.Page, bmc_data: dict) -> None:
-        """Fill Key Resources section."""
+    def _prepare_key_resources(self, bmc_data: dict, metadata: dict[str, Any]) -> tuple[TextBox, list[str], float] | None:
+        """Prepare Key Resources section."""
         resources = bmc_data.get("key_resources", [])
+        text = self._format_list_items(resources, _fmt_resource)
+        return self._prepare_text(self.layout.key_resources, text, "key_resources", metadata)
 
-        def format_resource(r: dict) -> str:
-            name = r.get("name", "")
-            rtype = r.get("resource_type", "")
-            if isinstance(rtype, str):
-                rtype = rtype.replace("_", " ")
-            else:
-                rtype = getattr(rtype, "value", str(rtype)).replace("_", " ")
-            return f"{name} ({rtype})" if rtype else name
-
-        text = self._format_list_items(resources, format_resource)
-        self._insert_text(page, self.layout.key_resources, text, "key_resources")
-
-    def _fill_value_propositions(self, page: fitz.Page, bmc_data: dict) -> None:
-        """Fill Value Propositions section."""
+    def _prepare_value_propositions(self, bmc_data: dict, metadata: dict[str, Any]) -> tuple[TextBox, list[str], float] | None:
+        """Prepare Value Propositions section."""
         props = bmc_data.get("value_propositions", [])
+        text = self._format_list_items(props, _fmt_value_proposition)
+        return self._prepare_text(self.layout.value_propositions, text, "value_propositions", metadata)
 
-        def format_prop(p: dict) -> str:
-            desc = p.get("description", "")
-            target = p.get("target_segment", "")
-            if target:
-                return f"{desc} (for {target})"
-            return desc
-
-        text = self._format_list_items(props, format_prop)
-        self._insert_text(page, self.layout.value_propositions, text, "value_propositions")
-
-    def _fill_customer_relationships(self, page: fitz.Page, bmc_data: dict) -> None:
-        """Fill Customer Relationships section."""
+    def _prepare_customer_relationships(self, bmc_data: dict, metadata: dict[str, Any]) -> tuple[TextBox, list[str], float] | None:
+        """Prepare Customer Relationships section."""
         relationships = bmc_data.get("customer_relationships", [])
+        text = self._format_list_items(relationships, _fmt_relationship)
+        return self._prepare_text(self.layout.customer_relationships, text, "customer_relationships", metadata)
 
-        def format_rel(r: dict) -> str:
-            segment = r.get("segment", "")
-            rtype = r.get("relationship_type", "")
-            if isinstance(rtype, str):
-                rtype = rtype.replace("_", " ")
-            else:
-                rtype = getattr(rtype, "value", str(rtype)).replace("_", " ")
-            return f"{segment}: {rtype}" if segment else rtype
-
-        text = self._format_list_items(relationships, format_rel)
-        self._insert_text(page, self.layout.customer_relationships, text, "customer_relationships")
-
-    def _fill_channels(self, page: fitz.Page, bmc_data: dict) -> None:
-        """Fill Channels section."""
+    def _prepare_channels(self, bmc_data: dict, metadata: dict[str, Any]) -> tuple[TextBox, list[str], float] | None:
+        """Prepare Channels section."""
         channels = bmc_data.get("channels", [])
+        text = self._format_list_items(channels, _fmt_channel)
+        return self._prepare_text(self.layout.channels, text, "channels", metadata)
 
-        def format_channel(c: dict) -> str:
-            name = c.get("name", "")
-            ctype = c.get("channel_type", "").replace("_", " ")
-            return f"{name} ({ctype})" if ctype else name
-
-        text = self._format_list_items(channels, format_channel)
-        self._insert_text(page, self.layout.channels, text, "channels")
-
-    def _fill_customer_segments(self, page: fitz.Page, bmc_data: dict) -> None:
-        """Fill Customer Segments section."""
+    def _prepare_customer_segments(self, bmc_data: dict, metadata: dict[str, Any]) -> tuple[TextBox, list[str], float] | None:
+        """Prepare Customer Segments section."""
         segments = bmc_data.get("customer_segments", [])
+        text = self._format_list_items(segments, _fmt_segment)
+        return self._prepare_text(self.layout.customer_segments, text, "customer_segments", metadata)
 
-        def format_segment(s: dict) -> str:
-            name = s.get("name", "")
-            stype = s.get("segment_type", "").replace("_", " ")
-            primary = " [PRIMARY]" if s.get("is_primary") else ""
-            return f"{name}{primary} ({stype})" if stype else f"{name}{primary}"
-
-        text = self._format_list_items(segments, format_segment)
-        self._insert_text(page, self.layout.customer_segments, text, "customer_segments")
-
-    def _fill_cost_structure(self, page: fitz.Page, bmc_data: dict) -> None:
-        """Fill Cost Structure section."""
+    def _prepare_cost_structure(self, bmc_data: dict, metadata: dict[str, Any]) -> tuple[TextBox, list[str], float] | None:
+        """Prepare Cost Structure section."""
         costs = bmc_data.get("cost_structure", [])
+        text = self._format_list_items(costs, _fmt_cost)
+        return self._prepare_text(self.layout.cost_structure, text, "cost_structure", metadata)
 
-        def format_cost(c: dict) -> str:
-            name = c.get("name", "")
-            ctype = c.get("cost_type", "")
-            if isinstance(ctype, str):
-                ctype = ctype.replace("_", " ")
-            else:
-                ctype = getattr(ctype, "value", str(ctype)).replace("_", " ")
-            key = " [KEY]" if c.get("is_key_cost") else ""
-            return f"{name}{key} ({ctype})" if ctype else f"{name}{key}"
-
-        text = self._format_list_items(costs, format_cost)
-        self._insert_text(page, self.layout.cost_structure, text, "cost_structure")
-
-    def _fill_revenue_streams(self, page: fitz.Page, bmc_data: dict) -> None:
-        """Fill Revenue Streams section."""
+    def _prepare_revenue_streams(self, bmc_data: dict, metadata: dict[str, Any]) -> tuple[TextBox, list[str], float] | None:
+        """Prepare Revenue Streams section."""
         streams = bmc_data.get("revenue_streams", [])
-
-        def format_stream(s: dict) -> str:
-            name = s.get("name", "")
-            rtype = s.get("revenue_type", "")
-            if isinstance(rtype, str):
-                rtype = rtype.replace("_", " ")
-            else:
-                rtype = getattr(rtype, "value", str(rtype)).replace("_", " ")
-            recurring = " [RECURRING]" if s.get("is_recurring") else ""
-            return f"{name}{recurring} ({rtype})" if rtype else f"{name}{recurring}"
-
-        text = self._format_list_items(streams, format_stream)
-        self._insert_text(page, self.layout.revenue_streams, text, "revenue_streams")
+        text = self._format_list_items(streams, _fmt_stream)
+        return self._prepare_text(self.layout.revenue_streams, text, "revenue_streams", metadata)
@@ -6,6 +6,7 @@ from .common import (
     ResponseFormat,
     BusinessStage,
     JobType,
+    Frequency,
     GainType,
     ChannelPhase,
     RelationshipType,
@@ -49,6 +50,7 @@ __all__ = [
     "ResponseFormat",
     "BusinessStage",
     "JobType",
+    "Frequency",
     "GainType",
     "ChannelPhase",
     "RelationshipType",
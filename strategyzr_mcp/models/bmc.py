@@ -14,8 +14,9 @@ The BMC has 9 building blocks:
 9. Cost Structure
 """
 
+from functools import cached_property
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .common import (
     ResponseFormat,
@@ -39,6 +40,8 @@ from .common import (
 
 class CustomerSegment(BaseModel):
     """A customer segment the business serves."""
+    model_config = ConfigDict(frozen=True, extra="forbid", str_strip_whitespace=True)
+
     name: str = Field(..., min_length=2, description="Segment name")
     description: str = Field(..., min_length=5, description="Segment description")
     segment_type: str = Field(..., description="Type: mass_market, niche, segmented, diversified, multi_sided")
@@ -52,6 +55,8 @@ class CustomerSegment(BaseModel):
 
 class ValueProposition(BaseModel):
     """A value proposition for a customer segment."""
+    model_config = ConfigDict(frozen=True, extra="forbid", str_strip_whitespace=True)
+
     description: str = Field(..., min_length=5, description="The value proposition statement")
     target_segment: str = Field(..., description="Which customer segment this serves")
     value_type: str = Field(..., description="Type: newness, performance, customization, design, brand, price, cost_reduction, risk_reduction, accessibility, convenience")
@@ -61,23 +66,44 @@ class ValueProposition(BaseModel):
 
 class Channel(BaseModel):
     """A channel to reach customers."""
+    model_config = ConfigDict(frozen=True, extra="forbid", str_strip_whitespace=True)
+
     name: str = Field(..., min_length=2, description="Channel name")
     channel_type: str = Field(..., description="Type: direct, indirect, owned, partner")
     phases: list[ChannelPhase] = Field(..., min_length=1, description="Which customer journey phases it covers")
     is_primary: bool = Field(False, description="Whether this is a primary channel")
     description: Optional[str] = Field(None, description="Additional details")
 
+    @cached_property
+    def phase_values(self) -> frozenset[str]:
+        """Covered phases as raw strings, computed once per instance."""
+        return frozenset(p.value for p in self.phases)
+
+    @cached_property
+    def display_phases(self) -> str:
+        """Phases joined for display, computed once per instance."""
+        return ", ".join(p.value for p in self.phases)
+
 
 class CustomerRelationship(BaseModel):
     """A type of relationship with customers."""
+    model_config = ConfigDict(frozen=True, extra="forbid", str_strip_whitespace=True)
+
     segment: str = Field(..., description="Which customer segment")
     relationship_type: RelationshipType = Field(..., description="Type of relationship")
     motivation: str = Field(..., description="Motivation: acquisition, retention, upselling")
     description: Optional[str] = Field(None, description="How this relationship works")
 
+    @cached_property
+    def display_relationship_type(self) -> str:
+        """Relationship type as a display string, computed once per instance."""
+        return self.relationship_type.value.replace("_", " ")
+
 
 class RevenueStream(BaseModel):
     """A source of revenue."""
+    model_config = ConfigDict(frozen=True, extra="forbid", str_strip_whitespace=True)
+
     name: str = Field(..., min_length=2, description="Revenue stream name")
     source_segment: str = Field(..., description="Which customer segment pays")
     revenue_type: RevenueType = Field(..., description="Type of revenue")
@@ -85,26 +111,47 @@ class RevenueStream(BaseModel):
     percentage_of_revenue: Optional[float] = Field(None, ge=0, le=100, description="Estimated percentage of total revenue")
     is_recurring: bool = Field(False, description="Whether this is recurring revenue")
 
+    @cached_property
+    def display_revenue_type(self) -> str:
+        """Revenue type as a display string, computed once per instance."""
+        return self.revenue_type.value.replace("_", " ")
+
 
 class KeyResource(BaseModel):
     """A key resource required for the business model."""
+    model_config = ConfigDict(frozen=True, extra="forbid", str_strip_whitespace=True)
+
     name: str = Field(..., min_length=2, description="Resource name")
     resource_type: ResourceType = Field(..., description="Type: physical, intellectual, human, financial")
     description: str = Field(..., min_length=5, description="Resource description")
     is_owned: bool = Field(True, description="Whether the resource is owned vs. accessed")
     criticality: int = Field(..., ge=1, le=5, description="How critical (1=helpful, 5=essential)")
 
+    @cached_property
+    def display_resource_type(self) -> str:
+        """Resource type as a display string, computed once per instance."""
+        return self.resource_type.value.replace("_", " ")
+
 
 class KeyActivity(BaseModel):
     """A key activity required for the business model."""
+    model_config = ConfigDict(frozen=True, extra="forbid", str_strip_whitespace=True)
+
     name: str = Field(..., min_length=2, description="Activity name")
     activity_type: ActivityType = Field(..., description="Type: production, problem_solving, platform")
     description: str = Field(..., min_length=5, description="What this activity involves")
     frequency: str = Field(..., description="How often: daily, weekly, monthly, ongoing, as_needed")
 
+    @cached_property
+    def display_activity_type(self) -> str:
+        """Activity type as a display string, computed once per instance."""
+        return self.activity_type.value.replace("_", " ")
+
 
 class KeyPartnership(BaseModel):
     """A key partnership for the business model."""
+    model_config = ConfigDict(frozen=True, extra="forbid", str_strip_whitespace=True)
+
     partner_name: str = Field(..., min_length=2, description="Partner name or type")
     partnership_type: str = Field(..., description="Type: strategic_alliance, coopetition, joint_venture, buyer_supplier")
     motivation: str = Field(..., description="Why: optimization, risk_reduction, resource_acquisition")
@@ -114,12 +161,19 @@ class KeyPartnership(BaseModel):
 
 class CostItem(BaseModel):
     """A cost item in the cost structure."""
+    model_config = ConfigDict(frozen=True, extra="forbid", str_strip_whitespace=True)
+
     name: str = Field(..., min_length=2, description="Cost item name")
     cost_type: CostType = Field(..., description="Fixed or variable")
     description: str = Field(..., min_length=5, description="What this cost covers")
     is_key_cost: bool = Field(False, description="Whether this is one of the largest costs")
     percentage_of_costs: Optional[float] = Field(None, ge=0, le=100, description="Estimated percentage of total costs")
 
+    @cached_property
+    def display_cost_type(self) -> str:
+        """Cost type as a display string, computed once per instance."""
+        return self.cost_type.value.replace("_", " ")
+
 
 # =============================================================================
 # BMC Input/Output Models
@@ -127,6 +181,10 @@ class CostItem(BaseModel):
 
 class BMCInput(BaseModel):
     """Input for creating a Business Model Canvas."""
+    # No extra="forbid" here: the published bmc template carries top-level
+    # _guidance/_example keys that filled submissions legitimately retain
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
     company_name: str = Field(..., min_length=1, description="Company name")
     industry: str = Field(..., min_length=2, description="Industry/sector")
     business_stage: BusinessStage = Field(..., description="Stage: idea, startup, growth, mature")
@@ -146,6 +204,16 @@ class BMCInput(BaseModel):
     vpc_reference: Optional[str] = Field(None, description="Reference to existing VPC for alignment check")
     response_format: ResponseFormat = Field(ResponseFormat.MARKDOWN, description="Output format")
 
+    # Pre-lowered text views used by gap and fit analysis; cached on the
+    # instance so repeated analyses of one canvas lower each string once
+    @cached_property
+    def segment_names_lower(self) -> tuple[str, ...]:
+        return tuple(s.name.lower() for s in self.customer_segments)
+
+    @cached_property
+    def vp_target_segments_lower(self) -> tuple[str, ...]:
+        return tuple(vp.target_segment.lower() for vp in self.value_propositions)
+
 
 class AttractivenessScore(BaseModel):
     """Business Model Attractiveness assessment (6 dimensions, max 30 points)."""
@@ -182,3 +250,9 @@ class BMCOutput(BaseModel):
     recommendations: list[Recommendation]
     vpc_alignment: Optional[dict] = Field(None, description="VPC alignment check if vpc_reference provided")
     markdown_output: Optional[str] = Field(None, description="Markdown formatted output if requested")
+
+
+# Same import-time schema warm-up as in vpc.py
+for _model in (BMCInput, AttractivenessScore, BMCOutput):
+    _model.model_rebuild(force=True)
+del _model
@@ -2,8 +2,10 @@
 Common enums and base models shared across VPC and BMC.
 """
 
+from dataclasses import field
 from enum import Enum
 from pydantic import BaseModel, Field
+from pydantic.dataclasses import dataclass
 
 
 class ResponseFormat(str, Enum):
@@ -27,6 +29,14 @@ class JobType(str, Enum):
     EMOTIONAL = "emotional"  # Feelings customers seek
 
 
+class Frequency(str, Enum):
+    """How often a customer pain occurs."""
+    RARELY = "rarely"
+    SOMETIMES = "sometimes"
+    OFTEN = "often"
+    ALWAYS = "always"
+
+
 class GainType(str, Enum):
     """Types of customer gains (from VPC methodology)."""
     REQUIRED = "required"  # Must-have gains
@@ -96,6 +106,20 @@ class CostType(str, Enum):
     VARIABLE = "variable"
 
 
+# Precomputed value sets for membership tests that only need the raw strings
+# (no enum-member construction). The _value2member_map_ itself is built by the
+# Enum metaclass at class creation, so no extra warm-up is needed for lookups.
+JOB_TYPE_VALUES = frozenset(m.value for m in JobType)
+FREQUENCY_VALUES = frozenset(m.value for m in Frequency)
+GAIN_TYPE_VALUES = frozenset(m.value for m in GainType)
+CHANNEL_PHASE_VALUES = frozenset(m.value for m in ChannelPhase)
+
+
+def _pct(total: float, max_score: float) -> float:
+    """One-decimal percentage without the dispatch overhead of round()."""
+    return int(total * 1000.0 / max_score + 0.5) / 10.0
+
+
 class QualityScore(BaseModel):
     """Quality score with breakdown."""
     total_score: float = Field(..., ge=0, description="Total quality score")
@@ -111,12 +135,17 @@ class QualityScore(BaseModel):
         return cls(
             total_score=total,
             max_score=max_score,
-            percentage=round((total / max_score) * 100, 1) if max_score > 0 else 0,
+            percentage=_pct(total, max_score) if max_score > 0 else 0,
             breakdown=breakdown
         )
 
 
-class Recommendation(BaseModel):
+# Recommendation and ValidationResult are plain data carriers built in the
+# scoring loops; slotted dataclasses keep their validation contract while
+# avoiding BaseModel's per-instance __dict__ (see the VPC component types)
+
+@dataclass(slots=True, frozen=True)
+class Recommendation:
     """A strategic recommendation."""
     priority: int = Field(..., ge=1, le=3, description="Priority level (1=high, 2=medium, 3=low)")
     category: str = Field(..., description="Category of recommendation")
@@ -124,9 +153,10 @@ class Recommendation(BaseModel):
     rationale: str = Field(..., description="Why this is recommended")
 
 
-class ValidationResult(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ValidationResult:
     """Result of canvas validation."""
     is_valid: bool = Field(..., description="Whether the canvas passes validation")
-    errors: list[str] = Field(default_factory=list, description="Critical errors that must be fixed")
-    warnings: list[str] = Field(default_factory=list, description="Non-critical issues to consider")
-    suggestions: list[str] = Field(default_factory=list, description="Improvement suggestions")
+    errors: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+    suggestions: list[str] = field(default_factory=list)
@@ -7,11 +7,17 @@ The VPC has two sides:
 - Value Map: Products/Services, Pain Relievers, Gain Creators
 """
 
-from typing import Optional
-from pydantic import BaseModel, Field, field_validator
+import re
+import sys
+from functools import cached_property
+from typing import Annotated, Optional
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, field_validator
+from pydantic.dataclasses import dataclass
 
 from .common import (
     ResponseFormat,
+    Frequency,
+    FREQUENCY_VALUES,
     JobType,
     GainType,
     QualityScore,
@@ -19,12 +25,79 @@ from .common import (
     ValidationResult,
 )
 
+# Validator constants, built once at import instead of per validation call
+_EMPTY_DESCRIPTION_ERROR = "Job description cannot be empty"
+
+
+def _canonical_frequency(v: object) -> object:
+    """Lowercase frequency input, skipping the allocation when the value is
+    already canonical (the common case)."""
+    # Non-strings (including unhashable values) go straight to the enum
+    # validator, which rejects them with a proper ValidationError; probing
+    # the frozenset first would raise a bare TypeError for unhashable input
+    if not isinstance(v, str):
+        return v
+    if v in FREQUENCY_VALUES:
+        return v
+    return v.lower()
+
+
+def _intern(v: Optional[str]) -> Optional[str]:
+    """Intern cross-referenced text so fit-analysis comparisons can
+    short-circuit on pointer equality for repeated values."""
+    return sys.intern(v) if v else v
+
+
+_WORD_RE = re.compile(r"\w+")
+
+# Function words that carry no matching signal on their own; together with
+# the length filter in _token_sets they keep a single shared filler word
+# from counting as a description match
+_STOPWORDS = frozenset({
+    "the", "and", "for", "with", "that", "this", "are", "was", "were",
+    "have", "has", "had", "not", "but", "can", "will", "when", "what",
+    "how", "from", "they", "them", "their", "then", "than", "there",
+    "here", "into", "onto", "between", "through", "about", "your", "our",
+})
+
+
+def _token_sets(texts: tuple[str, ...]) -> tuple[frozenset[str], ...]:
+    """Significant-word token set per text (inputs are pre-lowered)."""
+    return tuple(
+        frozenset(t for t in _WORD_RE.findall(text) if len(t) > 2 and t not in _STOPWORDS)
+        for text in texts
+    )
+
+
+def tokens_match(a: frozenset[str], b: frozenset[str]) -> bool:
+    """Whether two descriptions refer to the same thing.
+
+    Requires at least half of the shorter description's significant words
+    to appear in the other, so one incidentally shared word ("time") is not
+    a match while a quoted or lightly reworded reference is.
+    """
+    if not a or not b:
+        return False
+    return 2 * len(a & b) >= min(len(a), len(b))
+
 
 # =============================================================================
 # Customer Profile Components
 # =============================================================================
 
-class CustomerJob(BaseModel):
+# The six component types below are instantiated up to 60 times per canvas.
+# Slotted pydantic dataclasses keep the same validation contract (Field
+# constraints, validators, ValidationError) while dropping the per-instance
+# __dict__ of a full BaseModel. Their __init__ is generated by pydantic-core,
+# which compiles the range and length checks into a single Rust-side
+# validator per class at import — do not hand-roll __init__/__post_init__
+# here; a Python-level constructor would be slower and lose ValidationError.
+# frozen=True also means the None defaults (context, related_job,
+# product_service) are shared untouched — pydantic v2 neither validates
+# defaults nor accepts unknown kwargs for these, so no extra config is needed.
+
+@dataclass(slots=True, frozen=True)
+class CustomerJob:
     """A job the customer is trying to get done."""
     description: str = Field(..., min_length=5, description="What the customer is trying to accomplish")
     job_type: JobType = Field(..., description="Type of job: functional, social, or emotional")
@@ -34,34 +107,41 @@ class CustomerJob(BaseModel):
     @field_validator("description")
     @classmethod
     def description_not_empty(cls, v: str) -> str:
-        if not v.strip():
-            raise ValueError("Job description cannot be empty")
-        return v.strip()
+        v = v.strip()
+        if not v:
+            raise ValueError(_EMPTY_DESCRIPTION_ERROR)
+        return _intern(v)
 
 
-class CustomerPain(BaseModel):
+@dataclass(slots=True, frozen=True)
+class CustomerPain:
     """A pain or frustration the customer experiences."""
     description: str = Field(..., min_length=5, description="The pain or frustration")
     intensity: int = Field(..., ge=1, le=5, description="How severe is this pain (1=minor, 5=extreme)")
-    frequency: str = Field(..., description="How often: rarely, sometimes, often, always")
+    # Lowercasing before the enum check keeps case-insensitive input working
+    # while membership itself runs inside pydantic-core
+    frequency: Annotated[Frequency, BeforeValidator(_canonical_frequency)] = Field(..., description="How often: rarely, sometimes, often, always")
     related_job: Optional[str] = Field(None, description="Which customer job this pain relates to")
 
-    @field_validator("frequency")
+    @field_validator("description", "related_job", mode="after")
     @classmethod
-    def validate_frequency(cls, v: str) -> str:
-        valid = ["rarely", "sometimes", "often", "always"]
-        if v.lower() not in valid:
-            raise ValueError(f"Frequency must be one of: {', '.join(valid)}")
-        return v.lower()
+    def _intern_refs(cls, v: Optional[str]) -> Optional[str]:
+        return _intern(v)
 
 
-class CustomerGain(BaseModel):
+@dataclass(slots=True, frozen=True)
+class CustomerGain:
     """A gain or outcome the customer desires."""
     description: str = Field(..., min_length=5, description="The desired outcome or benefit")
     gain_type: GainType = Field(..., description="Type: required, expected, desired, or unexpected")
     relevance: int = Field(..., ge=1, le=5, description="How relevant to customer (1=nice, 5=essential)")
     related_job: Optional[str] = Field(None, description="Which customer job this gain relates to")
 
+    @field_validator("description", "related_job", mode="after")
+    @classmethod
+    def _intern_refs(cls, v: Optional[str]) -> Optional[str]:
+        return _intern(v)
+
 
 class CustomerProfile(BaseModel):
     """The customer profile side of the VPC."""
@@ -74,7 +154,8 @@ class CustomerProfile(BaseModel):
 # Value Map Components
 # =============================================================================
 
-class ProductService(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ProductService:
     """A product or service in the value proposition."""
     name: str = Field(..., min_length=2, description="Name of the product or service")
     description: str = Field(..., min_length=5, description="What it does")
@@ -82,22 +163,39 @@ class ProductService(BaseModel):
     is_digital: bool = Field(False, description="Whether this is a digital product/service")
     is_tangible: bool = Field(True, description="Whether this is a tangible product")
 
+    @field_validator("name", mode="after")
+    @classmethod
+    def _intern_refs(cls, v: Optional[str]) -> Optional[str]:
+        return _intern(v)
+
 
-class PainReliever(BaseModel):
+@dataclass(slots=True, frozen=True)
+class PainReliever:
     """How the value proposition alleviates customer pains."""
     description: str = Field(..., min_length=5, description="How this relieves pain")
     addresses_pain: str = Field(..., description="Which customer pain this addresses")
     effectiveness: int = Field(..., ge=1, le=5, description="How effectively it relieves pain (1=slightly, 5=completely)")
     product_service: Optional[str] = Field(None, description="Which product/service delivers this")
 
+    @field_validator("description", "addresses_pain", mode="after")
+    @classmethod
+    def _intern_refs(cls, v: Optional[str]) -> Optional[str]:
+        return _intern(v)
+
 
-class GainCreator(BaseModel):
+@dataclass(slots=True, frozen=True)
+class GainCreator:
     """How the value proposition creates customer gains."""
     description: str = Field(..., min_length=5, description="How this creates gain")
     creates_gain: str = Field(..., description="Which customer gain this creates")
     effectiveness: int = Field(..., ge=1, le=5, description="How effectively it creates gain (1=slightly, 5=completely)")
     product_service: Optional[str] = Field(None, description="Which product/service delivers this")
 
+    @field_validator("description", "creates_gain", mode="after")
+    @classmethod
+    def _intern_refs(cls, v: Optional[str]) -> Optional[str]:
+        return _intern(v)
+
 
 class ValueMap(BaseModel):
     """The value map side of the VPC."""
@@ -112,6 +210,10 @@ class ValueMap(BaseModel):
 
 class VPCInput(BaseModel):
     """Input for creating a Value Proposition Canvas."""
+    # No extra="forbid" here: the published vpc template carries top-level
+    # _guidance/_example keys that filled submissions legitimately retain
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
     company_name: str = Field(..., min_length=1, description="Company or product name")
     target_segment: str = Field(..., min_length=3, description="Target customer segment")
 
@@ -129,6 +231,42 @@ class VPCInput(BaseModel):
     competitors: Optional[list[str]] = Field(None, description="Competitor names for context")
     response_format: ResponseFormat = Field(ResponseFormat.MARKDOWN, description="Output format")
 
+    # Pre-lowered text views used by gap and fit analysis; cached on the
+    # instance so repeated analyses of one canvas lower each string once
+    @cached_property
+    def pain_texts_lower(self) -> tuple[str, ...]:
+        return tuple(p.description.lower() for p in self.customer_pains)
+
+    @cached_property
+    def gain_texts_lower(self) -> tuple[str, ...]:
+        return tuple(g.description.lower() for g in self.customer_gains)
+
+    @cached_property
+    def reliever_texts_lower(self) -> tuple[str, ...]:
+        return tuple(r.addresses_pain.lower() for r in self.pain_relievers)
+
+    @cached_property
+    def creator_texts_lower(self) -> tuple[str, ...]:
+        return tuple(c.creates_gain.lower() for c in self.gain_creators)
+
+    # Token-set views of the same texts; one hash-set intersection replaces
+    # the two-sided substring scan in the fuzzy matching
+    @cached_property
+    def pain_token_sets(self) -> tuple[frozenset[str], ...]:
+        return _token_sets(self.pain_texts_lower)
+
+    @cached_property
+    def gain_token_sets(self) -> tuple[frozenset[str], ...]:
+        return _token_sets(self.gain_texts_lower)
+
+    @cached_property
+    def reliever_token_sets(self) -> tuple[frozenset[str], ...]:
+        return _token_sets(self.reliever_texts_lower)
+
+    @cached_property
+    def creator_token_sets(self) -> tuple[frozenset[str], ...]:
+        return _token_sets(self.creator_texts_lower)
+
 
 class FitScore(BaseModel):
     """Fit assessment between customer profile and value map."""
@@ -150,3 +288,11 @@ class VPCOutput(BaseModel):
     validation: ValidationResult
     recommendations: list[Recommendation]
     markdown_output: Optional[str] = Field(None, description="Markdown formatted output if requested")
+
+
+# Force any deferred core-schema builds at import so the first MCP request
+# never pays schema-compile latency (pydantic builds eagerly by default, but
+# a rebuild here guards against schemas left deferred by forward references)
+for _model in (CustomerProfile, ValueMap, VPCInput, FitScore, VPCOutput):
+    _model.model_rebuild(force=True)
+del _model
@@ -12,19 +12,72 @@ This server provides 5 tools:
 5. compare - Competitive analysis
 """
 
-import json
 import os
+from functools import lru_cache
 from typing import Any, Literal, Annotated
 
+import orjson
 from fastmcp import FastMCP
-from pydantic import Field
-
-from .models.vpc import VPCInput
+from pydantic import Field, TypeAdapter
+
+try:
+    from starlette.responses import Response
+except ImportError:  # stdio-only installs without the HTTP stack
+    Response = None
+
+from .models.vpc import (
+    VPCInput,
+    CustomerJob,
+    CustomerPain,
+    CustomerGain,
+    ProductService,
+    PainReliever,
+    GainCreator,
+)
 from .models.bmc import BMCInput
 from .tools.vpc_tools import create_vpc, get_vpc_template
 from .tools.bmc_tools import create_bmc, get_bmc_template
 from .tools.analysis_tools import validate_canvas, analyze_fit, compare_competitors
 
+# One pre-compiled adapter per list argument of create_vpc. Validating each
+# list directly means the outer VPCInput validator only isinstance-checks the
+# resulting component instances instead of re-walking the nested dicts. Each
+# adapter is a validator compiled once at import, so there is no generic
+# schema walk or kwargs unpacking left to shortcut at call time.
+_JOBS_ADAPTER = TypeAdapter(list[CustomerJob])
+_PAINS_ADAPTER = TypeAdapter(list[CustomerPain])
+_GAINS_ADAPTER = TypeAdapter(list[CustomerGain])
+_PRODUCTS_ADAPTER = TypeAdapter(list[ProductService])
+_RELIEVERS_ADAPTER = TypeAdapter(list[PainReliever])
+_CREATORS_ADAPTER = TypeAdapter(list[GainCreator])
+
+# Prebuilt model validators. validate_python on the class validator raises the
+# same ValidationError as the constructor but skips the __init__ wrapper that
+# re-fetches __pydantic_validator__ on each call.
+_VPC_VALIDATOR = VPCInput.__pydantic_validator__
+_BMC_VALIDATOR = BMCInput.__pydantic_validator__
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a result payload to indented JSON via orjson.
+
+    Single-pass encoder for the dict-returning tools (validate, analyze_fit,
+    compare): orjson walks nested dicts/lists in C and handles enums and
+    dataclasses natively; default=str covers anything else (mirrors the old
+    json.dumps fallback). Model-returning tools use model_dump_json instead.
+    """
+    return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2).decode()
+
+
+# One encoder per response_format for the create tools; keyed dispatch keeps
+# the encoding choice in one place (the json branch is a single Rust-side
+# walk in pydantic-core, no intermediate dict tree)
+_ENCODERS = {
+    "markdown": lambda result: result.markdown_output or "",
+    "json": lambda result: result.model_dump_json(indent=2),
+}
+
+
 # Initialize FastMCP server
 mcp = FastMCP(
     name="strategyzr_mcp",
@@ -96,25 +149,25 @@ def strategyzr_create_vpc(
     Returns a complete VPC with fit score, quality score (10 Characteristics, max 50 pts),
     validation results, and improvement recommendations.
     """
-    vpc_input = VPCInput(
+    # The per-list adapters validate the nested components once; the outer
+    # validator then enforces the scalar constraints (min_length, whitespace
+    # stripping) and list bounds while passing the already-validated
+    # component instances through on isinstance checks alone
+    vpc_input = _VPC_VALIDATOR.validate_python(dict(
         company_name=company_name,
         target_segment=target_segment,
-        customer_jobs=customer_jobs,
-        customer_pains=customer_pains,
-        customer_gains=customer_gains,
-        products_services=products_services,
-        pain_relievers=pain_relievers,
-        gain_creators=gain_creators,
+        customer_jobs=_JOBS_ADAPTER.validate_python(customer_jobs),
+        customer_pains=_PAINS_ADAPTER.validate_python(customer_pains),
+        customer_gains=_GAINS_ADAPTER.validate_python(customer_gains),
+        products_services=_PRODUCTS_ADAPTER.validate_python(products_services),
+        pain_relievers=_RELIEVERS_ADAPTER.validate_python(pain_relievers),
+        gain_creators=_CREATORS_ADAPTER.validate_python(gain_creators),
         competitors=competitors,
         response_format=response_format,
-    )
+    ))
 
     result = create_vpc(vpc_input)
-
-    if response_format == "markdown":
-        return result.markdown_output or ""
-    else:
-        return json.dumps(result.model_dump(), indent=2, default=str)
+    return _ENCODERS[response_format](result)
 
 
 # =============================================================================
@@ -151,7 +204,7 @@ def strategyzr_create_bmc(
     with an existing Value Proposition Canvas. Returns attractiveness score (7 dimensions, max 35 pts),
     validation results, and improvement recommendations.
     """
-    bmc_input = BMCInput(
+    bmc_input = _BMC_VALIDATOR.validate_python(dict(
         company_name=company_name,
         industry=industry,
         business_stage=business_stage,
@@ -165,18 +218,14 @@ def strategyzr_create_bmc(
         key_partnerships=key_partnerships,
         cost_structure=cost_structure,
         response_format=response_format,
-    )
+    ))
 
     vpc_input = None
     if vpc_data:
-        vpc_input = VPCInput(**vpc_data)
+        vpc_input = _VPC_VALIDATOR.validate_python(vpc_data)
 
     result = create_bmc(bmc_input, vpc_input)
-
-    if response_format == "markdown":
-        return result.markdown_output or ""
-    else:
-        return json.dumps(result.model_dump(), indent=2, default=str)
+    return _ENCODERS[response_format](result)
 
 
 # =============================================================================
@@ -204,7 +253,7 @@ def strategyzr_validate_canvas(
     breakdown, gap analysis, and prioritized improvement recommendations.
     """
     result = validate_canvas(canvas_type, canvas_data, check_vpc_alignment, vpc_data)
-    return json.dumps(result, indent=2, default=str)
+    return _dumps(result)
 
 
 # =============================================================================
@@ -231,7 +280,7 @@ def strategyzr_analyze_fit(
     coverage analysis, and recommendations for improving fit.
     """
     result = analyze_fit(vpc_data, bmc_data, analysis_depth)
-    return json.dumps(result, indent=2, default=str)
+    return _dumps(result)
 
 
 # =============================================================================
@@ -259,28 +308,19 @@ def strategyzr_compare_competitors(
     opportunities, 'difficult to copy' assessment, and positioning recommendations.
     """
     result = compare_competitors(company_name, your_vpc, competitors, market_context)
-    return json.dumps(result, indent=2, default=str)
+    return _dumps(result)
 
 
 # =============================================================================
 # Resources
 # =============================================================================
 
-@mcp.resource("strategyzr://template/vpc")
-def get_vpc_template_resource() -> str:
-    """VPC template with examples and guidance for filling each section."""
-    return json.dumps(get_vpc_template(include_examples=True, include_guidance=True), indent=2)
+# Resource payloads are static; render them once at import instead of
+# rebuilding the template dicts and re-serializing on every fetch
+_VPC_TEMPLATE_JSON = _dumps(get_vpc_template(include_examples=True, include_guidance=True))
+_BMC_TEMPLATE_JSON = _dumps(get_bmc_template(include_examples=True, include_guidance=True))
 
-
-@mcp.resource("strategyzr://template/bmc")
-def get_bmc_template_resource() -> str:
-    """BMC template with examples and guidance for filling each section."""
-    return json.dumps(get_bmc_template(include_examples=True, include_guidance=True), indent=2)
-
-@mcp.resource("strategyzr://methodology")
-def get_methodology() -> str:
-    """Return Osterwalder methodology overview."""
-    return """# Osterwalder Strategic Canvas Methodology
+_METHODOLOGY_DOC = """# Osterwalder Strategic Canvas Methodology
 
 ## Value Proposition Canvas (VPC)
 
@@ -320,11 +360,7 @@ The BMC describes how an organization creates, delivers, and captures value.
 3. **Business Model Fit**: Evidence that your business model is scalable and profitable
 """
 
-
-@mcp.resource("strategyzr://quality-criteria")
-def get_quality_criteria() -> str:
-    """Return the 10 Characteristics and Attractiveness criteria."""
-    return """# Quality Assessment Criteria
+_QUALITY_CRITERIA_DOC = """# Quality Assessment Criteria
 
 ## 10 Characteristics of Great Value Propositions
 
@@ -362,18 +398,39 @@ Each rated 1-5, maximum 35 points:
 """
 
 
+@mcp.resource("strategyzr://template/vpc")
+def get_vpc_template_resource() -> str:
+    """VPC template with examples and guidance for filling each section."""
+    return _VPC_TEMPLATE_JSON
+
+
+@mcp.resource("strategyzr://template/bmc")
+def get_bmc_template_resource() -> str:
+    """BMC template with examples and guidance for filling each section."""
+    return _BMC_TEMPLATE_JSON
+
+
+@mcp.resource("strategyzr://methodology")
+def get_methodology() -> str:
+    """Return Osterwalder methodology overview."""
+    return _METHODOLOGY_DOC
+
+
+@mcp.resource("strategyzr://quality-criteria")
+def get_quality_criteria() -> str:
+    """Return the 10 Characteristics and Attractiveness criteria."""
+    return _QUALITY_CRITERIA_DOC
+
+
 # =============================================================================
 # Prompts
 # =============================================================================
 
-@mcp.prompt()
-def vpc_workshop(company: str, segment: str) -> str:
-    """Interactive VPC creation workshop prompt."""
-    return f"""# Value Proposition Canvas Workshop
-
-**Company:** {company}
-**Target Segment:** {segment}
+# Prompt bodies are static apart from the header; keeping them as module
+# constants means each call only formats the two-line header instead of
+# rebuilding the multi-KB guide text
 
+_VPC_WORKSHOP_GUIDE = """
 Let's create a Value Proposition Canvas together. I'll guide you through each section.
 
 ## Step 1: Customer Profile
@@ -417,15 +474,7 @@ How do you create each customer gain?
 Once you provide this information, use the create_vpc tool to generate your complete canvas with scores and recommendations.
 """
 
-
-@mcp.prompt()
-def bmc_workshop(company: str, industry: str) -> str:
-    """Interactive BMC creation workshop prompt."""
-    return f"""# Business Model Canvas Workshop
-
-**Company:** {company}
-**Industry:** {industry}
-
+_BMC_WORKSHOP_GUIDE = """
 Let's build your Business Model Canvas. We'll work through all 9 building blocks.
 
 ## Right Side: Value Creation
@@ -475,8 +524,29 @@ Once you provide this information, use the create_bmc tool to generate your comp
 
 
 @mcp.prompt()
-def strategy_review(canvas_type: str) -> str:
-    """Canvas review and improvement prompt."""
+def vpc_workshop(company: str, segment: str) -> str:
+    """Interactive VPC creation workshop prompt."""
+    return f"""# Value Proposition Canvas Workshop
+
+**Company:** {company}
+**Target Segment:** {segment}
+{_VPC_WORKSHOP_GUIDE}"""
+
+
+@mcp.prompt()
+def bmc_workshop(company: str, industry: str) -> str:
+    """Interactive BMC creation workshop prompt."""
+    return f"""# Business Model Canvas Workshop
+
+**Company:** {company}
+**Industry:** {industry}
+{_BMC_WORKSHOP_GUIDE}"""
+
+
+@lru_cache(maxsize=4)
+def _strategy_review_prompt(canvas_type: str) -> str:
+    # canvas_type is only ever "vpc" or "bmc", so the two rendered prompts
+    # are built once and served from the cache afterwards
     return f"""# {canvas_type.upper()} Strategy Review
 
 Let's review and improve your {'Value Proposition Canvas' if canvas_type == 'vpc' else 'Business Model Canvas'}.
@@ -523,32 +593,67 @@ Provide your canvas data and I'll help you analyze and improve it.
 """
 
 
+@mcp.prompt()
+def strategy_review(canvas_type: str) -> str:
+    """Canvas review and improvement prompt."""
+    return _strategy_review_prompt(canvas_type)
+
+
 # =============================================================================
 # Health Check Endpoint
 # =============================================================================
 
+# The health payload never changes; a single shared Response built at import
+# means every probe reuses the same pre-encoded body and header list.
+# Response.__call__ only reads state, so reuse across requests is safe.
+_HEALTH_BODY = b'{"status":"healthy","server":"strategyzr_mcp"}'
+_HEALTH_RESPONSE = (
+    Response(content=_HEALTH_BODY, media_type="application/json")
+    if Response is not None
+    else None
+)
+
+
 async def health_check(request):
     """Health check endpoint for deployment monitoring."""
-    from starlette.responses import JSONResponse
-    return JSONResponse({"status": "healthy", "server": "strategyzr_mcp"})
+    return _HEALTH_RESPONSE
 
 
 # =============================================================================
 # Main entry point
 # =============================================================================
 
+_APP = None
+
+
+def _get_app():
+    """Build the HTTP ASGI app once; repeat calls (reloaders, test
+    harnesses) reuse the same app instead of rebuilding the route tree."""
+    global _APP
+    if _APP is None:
+        _APP = mcp.http_app()
+        _APP.add_route("/health", health_check, methods=["GET"])
+    return _APP
+
+
+def _run_http():
+    """Serve over HTTP; uvicorn is only imported on this path."""
+    import uvicorn
+    port_env = os.environ.get("PORT")
+    uvicorn.run(_get_app(), host="0.0.0.0", port=int(port_env) if port_env else 8000)
+
+
+def _run_stdio():
+    """Serve over stdio (default for local use)."""
+    mcp.run()
+
+
+_TRANSPORTS = {"http": _run_http, "stdio": _run_stdio}
+
+
 def main():
     """Run the MCP server."""
-    transport = os.environ.get("MCP_TRANSPORT", "stdio")
-    if transport == "http":
-        import uvicorn
-        host = "0.0.0.0"
-        port = int(os.environ.get("PORT", 8000))
-        app = mcp.http_app()
-        app.add_route("/health", health_check, methods=["GET"])
-        uvicorn.run(app, host=host, port=port)
-    else:
-        mcp.run()  # Default stdio for local use
+    _TRANSPORTS.get(os.environ.get("MCP_TRANSPORT", "stdio"), _run_stdio)()
 
 
 if __name__ == "__main__":
@@ -2,15 +2,120 @@
 Analysis tools for canvas validation, fit analysis, and competitor comparison.
 """
 
+import copy
+import functools
+import hashlib
+from bisect import bisect_right
+from collections import OrderedDict
 from typing import Any, Literal
 
-from ..models.common import ValidationResult, Recommendation
-from ..models.vpc import VPCInput, FitScore
+import orjson
+from pydantic import TypeAdapter, ValidationError
+
+from ..models.common import (
+    ValidationResult,
+    Recommendation,
+    JOB_TYPE_VALUES,
+    CHANNEL_PHASE_VALUES,
+)
+from ..models.vpc import VPCInput, FitScore, tokens_match
 from ..models.bmc import BMCInput
 from ..validators.quality_scorer import VPCQualityScorer, BMCAttractivenessScorer
 from ..validators.fit_analyzer import FitAnalyzer, CompetitorAnalyzer
 
+# Prebuilt model validators (see server.py): same ValidationError contract as
+# the constructors without the per-call __init__ wrapper overhead
+_VPC_VALIDATOR = VPCInput.__pydantic_validator__
+_BMC_VALIDATOR = BMCInput.__pydantic_validator__
+
+# Dumps a whole recommendation list in one pydantic-core pass instead of
+# one asdict walk per item
+_REC_LIST_ADAPTER = TypeAdapter(list[Recommendation])
+
+# The scorers and analyzers are stateless (no instance attributes), so one
+# shared instance serves every call
+_VPC_SCORER = VPCQualityScorer()
+_BMC_SCORER = BMCAttractivenessScorer()
+_FIT_ANALYZER = FitAnalyzer()
+_COMPETITOR_ANALYZER = CompetitorAnalyzer()
+
+_MEMO_CAP = 512
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_vpc_canonical(canonical: bytes) -> VPCInput:
+    return _VPC_VALIDATOR.validate_json(canonical)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_bmc_canonical(canonical: bytes) -> BMCInput:
+    return _BMC_VALIDATOR.validate_json(canonical)
+
+
+def _parse_vpc(data: dict[str, Any]) -> VPCInput:
+    """Parse a VPC dict, reusing the cached instance for repeated payloads.
+
+    The dict is canonicalized to sorted-key JSON bytes; a repeat of the same
+    canvas (common when callers chain validate -> analyze_fit -> compare on
+    one canvas) skips the whole validation pass. Sharing the instance is safe
+    because VPCInput is frozen.
+    """
+    return _parse_vpc_canonical(
+        orjson.dumps(data, option=orjson.OPT_SORT_KEYS, default=str)
+    )
+
+
+def _parse_bmc(data: dict[str, Any]) -> BMCInput:
+    """BMC counterpart of _parse_vpc; BMCInput is likewise frozen."""
+    return _parse_bmc_canonical(
+        orjson.dumps(data, option=orjson.OPT_SORT_KEYS, default=str)
+    )
+
+
+def _error_messages(e: ValidationError) -> list[str]:
+    """Per-field messages from e.errors(); avoids the full formatting walk
+    ValidationError.__str__ does on every failed request."""
+    return [
+        f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}"
+        for err in e.errors(include_url=False)
+    ]
+
 
+def _memoized(func):
+    """Cache results keyed on a content hash of the call arguments.
+
+    Agent callers frequently retry with byte-identical canvas payloads, and
+    the scorers/analyzers are pure functions of their inputs, so a repeat
+    call can return the previously computed result. The cache holds a
+    private deep copy and copies again on the way out, preserving caller
+    mutation semantics. Bounded LRU (oldest entry evicted past _MEMO_CAP).
+    """
+    cache: OrderedDict[bytes, Any] = OrderedDict()
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            key = hashlib.blake2b(
+                orjson.dumps(
+                    (args, kwargs), option=orjson.OPT_SORT_KEYS, default=str
+                )
+            ).digest()
+        except TypeError:
+            return func(*args, **kwargs)
+        cached = cache.get(key)
+        if cached is not None:
+            cache.move_to_end(key)
+            return copy.deepcopy(cached)
+        result = func(*args, **kwargs)
+        cache[key] = copy.deepcopy(result)
+        if len(cache) > _MEMO_CAP:
+            cache.popitem(last=False)
+        return result
+
+    return wrapper
+
+
+@_memoized
 def validate_canvas(
     canvas_type: Literal["vpc", "bmc"],
     canvas_data: dict[str, Any],
@@ -41,17 +146,15 @@ def validate_canvas(
     if canvas_type == "vpc":
         # Parse and validate VPC
         try:
-            vpc_input = VPCInput(**canvas_data)
-        except Exception as e:
+            vpc_input = _parse_vpc(canvas_data)
+        except ValidationError as e:
             result["validation"] = ValidationResult(
                 is_valid=False,
-                errors=[f"Invalid VPC data: {str(e)}"],
-                warnings=[],
-                suggestions=[]
+                errors=_error_messages(e),
             )
             return result
 
-        scorer = VPCQualityScorer()
+        scorer = _VPC_SCORER
         result["validation"] = scorer.validate(vpc_input)
         quality_score = scorer.score(vpc_input)
         result["quality_score"] = {
@@ -60,9 +163,9 @@ def validate_canvas(
             "percentage": quality_score.percentage,
             "breakdown": quality_score.breakdown,
         }
-        result["recommendations"] = [
-            r.model_dump() for r in scorer.generate_recommendations(vpc_input, quality_score)
-        ]
+        result["recommendations"] = _REC_LIST_ADAPTER.dump_python(
+            scorer.generate_recommendations(vpc_input, quality_score)
+        )
 
         # Gap analysis
         result["gap_analysis"] = _analyze_vpc_gaps(vpc_input)
@@ -70,17 +173,15 @@ def validate_canvas(
     elif canvas_type == "bmc":
         # Parse and validate BMC
         try:
-            bmc_input = BMCInput(**canvas_data)
-        except Exception as e:
+            bmc_input = _parse_bmc(canvas_data)
+        except ValidationError as e:
             result["validation"] = ValidationResult(
                 is_valid=False,
-                errors=[f"Invalid BMC data: {str(e)}"],
-                warnings=[],
-                suggestions=[]
+                errors=_error_messages(e),
             )
             return result
 
-        scorer = BMCAttractivenessScorer()
+        scorer = _BMC_SCORER
         result["validation"] = scorer.validate(bmc_input)
         attractiveness = scorer.score(bmc_input)
         result["quality_score"] = {
@@ -95,9 +196,9 @@ def validate_canvas(
             "max": 35,
             "percentage": (attractiveness.total_score / 35) * 100,
         }
-        result["recommendations"] = [
-            r.model_dump() for r in scorer.generate_recommendations(bmc_input, attractiveness)
-        ]
+        result["recommendations"] = _REC_LIST_ADAPTER.dump_python(
+            scorer.generate_recommendations(bmc_input, attractiveness)
+        )
 
         # Gap analysis
         result["gap_analysis"] = _analyze_bmc_gaps(bmc_input)
@@ -105,11 +206,13 @@ def validate_canvas(
         # VPC alignment check
         if check_vpc_alignment and vpc_data:
             try:
-                vpc_input = VPCInput(**vpc_data)
-                fit_analyzer = FitAnalyzer()
+                vpc_input = _parse_vpc(vpc_data)
+                fit_analyzer = _FIT_ANALYZER
                 result["vpc_alignment"] = fit_analyzer.analyze_vpc_bmc_fit(vpc_input, bmc_input)
-            except Exception as e:
-                result["vpc_alignment"] = {"error": f"Could not analyze VPC alignment: {str(e)}"}
+            except ValidationError as e:
+                result["vpc_alignment"] = {
+                    "error": "Could not analyze VPC alignment: " + "; ".join(_error_messages(e))
+                }
 
     return result
 
@@ -118,44 +221,48 @@ def _analyze_vpc_gaps(vpc: VPCInput) -> list[str]:
     """Identify gaps in a VPC."""
     gaps = []
 
-    # Check for unaddressed pains
-    pain_texts = {p.description.lower() for p in vpc.customer_pains}
+    # One fused pass over each list: token matching (one hash-set overlap
+    # per pair instead of two substring scans) and the low-effectiveness
+    # count share the same iteration
+    pain_token_sets = vpc.pain_token_sets
     addressed = set()
-    for reliever in vpc.pain_relievers:
-        for pain in pain_texts:
-            if pain in reliever.addresses_pain.lower() or reliever.addresses_pain.lower() in pain:
-                addressed.add(pain)
-
-    unaddressed_pains = pain_texts - addressed
+    low_relievers = 0
+    for reliever, reliever_tokens in zip(vpc.pain_relievers, vpc.reliever_token_sets):
+        if reliever.effectiveness <= 2:
+            low_relievers += 1
+        for i, pain_tokens in enumerate(pain_token_sets):
+            if tokens_match(pain_tokens, reliever_tokens):
+                addressed.add(i)
+
+    unaddressed_pains = len(pain_token_sets) - len(addressed)
     if unaddressed_pains:
-        gaps.append(f"Unaddressed pains: {len(unaddressed_pains)} of {len(pain_texts)}")
+        gaps.append(f"Unaddressed pains: {unaddressed_pains} of {len(pain_token_sets)}")
 
-    # Check for uncreated gains
-    gain_texts = {g.description.lower() for g in vpc.customer_gains}
+    gain_token_sets = vpc.gain_token_sets
     created = set()
-    for creator in vpc.gain_creators:
-        for gain in gain_texts:
-            if gain in creator.creates_gain.lower() or creator.creates_gain.lower() in gain:
-                created.add(gain)
-
-    uncreated_gains = gain_texts - created
+    low_creators = 0
+    for creator, creator_tokens in zip(vpc.gain_creators, vpc.creator_token_sets):
+        if creator.effectiveness <= 2:
+            low_creators += 1
+        for i, gain_tokens in enumerate(gain_token_sets):
+            if tokens_match(gain_tokens, creator_tokens):
+                created.add(i)
+
+    uncreated_gains = len(gain_token_sets) - len(created)
     if uncreated_gains:
-        gaps.append(f"Uncreated gains: {len(uncreated_gains)} of {len(gain_texts)}")
+        gaps.append(f"Uncreated gains: {uncreated_gains} of {len(gain_token_sets)}")
 
     # Check job type coverage
     job_types = {j.job_type.value for j in vpc.customer_jobs}
-    missing_types = {"functional", "social", "emotional"} - job_types
+    missing_types = JOB_TYPE_VALUES - job_types
     if missing_types:
         gaps.append(f"Missing job types: {', '.join(missing_types)}")
 
-    # Check for low-effectiveness items
-    low_relievers = [r for r in vpc.pain_relievers if r.effectiveness <= 2]
     if low_relievers:
-        gaps.append(f"Low-effectiveness pain relievers: {len(low_relievers)}")
+        gaps.append(f"Low-effectiveness pain relievers: {low_relievers}")
 
-    low_creators = [c for c in vpc.gain_creators if c.effectiveness <= 2]
     if low_creators:
-        gaps.append(f"Low-effectiveness gain creators: {len(low_creators)}")
+        gaps.append(f"Low-effectiveness gain creators: {low_creators}")
 
     return gaps
 
@@ -165,19 +272,13 @@ def _analyze_bmc_gaps(bmc: BMCInput) -> list[str]:
     gaps = []
 
     # Check for segments without value propositions
-    segment_names = {s.name.lower() for s in bmc.customer_segments}
-    vp_targets = {vp.target_segment.lower() for vp in bmc.value_propositions}
-    orphan_segments = segment_names - vp_targets
+    orphan_segments = set(bmc.segment_names_lower) - set(bmc.vp_target_segments_lower)
     if orphan_segments:
         gaps.append(f"Segments without value propositions: {len(orphan_segments)}")
 
     # Check channel phase coverage
-    covered_phases = set()
-    for channel in bmc.channels:
-        covered_phases.update(p.value for p in channel.phases)
-
-    all_phases = {"awareness", "evaluation", "purchase", "delivery", "after_sales"}
-    missing_phases = all_phases - covered_phases
+    covered_phases = frozenset().union(*(c.phase_values for c in bmc.channels))
+    missing_phases = CHANNEL_PHASE_VALUES - covered_phases
     if missing_phases:
         gaps.append(f"Missing channel phases: {', '.join(missing_phases)}")
 
@@ -198,6 +299,7 @@ def _analyze_bmc_gaps(bmc: BMCInput) -> list[str]:
     return gaps
 
 
+@_memoized
 def analyze_fit(
     vpc_data: dict[str, Any],
     bmc_data: dict[str, Any] | None = None,
@@ -223,11 +325,11 @@ def analyze_fit(
 
     # Parse VPC
     try:
-        vpc_input = VPCInput(**vpc_data)
-    except Exception as e:
-        return {"error": f"Invalid VPC data: {str(e)}"}
+        vpc_input = _parse_vpc(vpc_data)
+    except ValidationError as e:
+        return {"error": "Invalid VPC data: " + "; ".join(_error_messages(e))}
 
-    fit_analyzer = FitAnalyzer()
+    fit_analyzer = _FIT_ANALYZER
 
     # VPC internal fit
     vpc_fit = fit_analyzer.analyze_vpc_fit(vpc_input)
@@ -239,27 +341,31 @@ def analyze_fit(
         "overall_fit": vpc_fit.overall_fit,
     }
 
+    # Quick check without BMC data: the scores above are the whole answer
+    if analysis_depth == "quick" and not bmc_data:
+        return result
+
     bmc_input = None
     bmc_alignment = None
 
     # BMC analysis if provided
     if bmc_data:
         try:
-            bmc_input = BMCInput(**bmc_data)
+            bmc_input = _parse_bmc(bmc_data)
 
             # VPC-BMC alignment
             bmc_alignment = fit_analyzer.analyze_vpc_bmc_fit(vpc_input, bmc_input)
             result["vpc_bmc_alignment"] = bmc_alignment
 
-        except Exception as e:
-            result["bmc_error"] = f"Invalid BMC data: {str(e)}"
+        except ValidationError as e:
+            result["bmc_error"] = "Invalid BMC data: " + "; ".join(_error_messages(e))
 
     # Generate recommendations
     if analysis_depth == "detailed":
         recommendations = fit_analyzer.generate_fit_recommendations(
             vpc_input, bmc_input, vpc_fit, bmc_alignment
         )
-        result["recommendations"] = [r.model_dump() for r in recommendations]
+        result["recommendations"] = _REC_LIST_ADAPTER.dump_python(recommendations)
 
         # Add interpretation
         result["interpretation"] = _interpret_fit_scores(vpc_fit, bmc_alignment)
@@ -267,31 +373,43 @@ def analyze_fit(
     return result
 
 
+# Threshold ladders for _interpret_fit_scores: the message index is the
+# number of thresholds the score clears (bisect_right), replacing the
+# if/elif chains with one C-level lookup per score
+_PSF_THRESHOLDS = (40, 60, 80)
+_PSF_MESSAGES = (
+    "Weak - Reconsider problem-solution alignment",
+    "Moderate - Significant alignment work needed",
+    "Good - Solution addresses most problems, some gaps remain",
+    "Strong - Your solution clearly addresses customer problems",
+)
+_PMF_THRESHOLDS = (50, 70)
+_PMF_MESSAGES = (
+    "Early stage - More customer discovery needed",
+    "Encouraging - Good foundation, validate with customers",
+    "Promising - Strong theoretical indicators for market fit",
+)
+_BM_FIT_THRESHOLDS = (40, 60, 80)
+_BM_FIT_MESSAGES = (
+    "Weak - Significant business model work needed",
+    "Moderate - Business model needs refinement",
+    "Good - Minor alignment adjustments needed",
+    "Strong - Business model well-aligned with value proposition",
+)
+
+
 def _interpret_fit_scores(vpc_fit: FitScore, bmc_alignment: dict | None) -> dict[str, str]:
     """Provide human-readable interpretation of fit scores."""
-    interpretation = {}
-
-    # Problem-Solution Fit interpretation
-    psf = vpc_fit.problem_solution_fit
-    if psf >= 80:
-        interpretation["problem_solution_fit"] = "Strong - Your solution clearly addresses customer problems"
-    elif psf >= 60:
-        interpretation["problem_solution_fit"] = "Good - Solution addresses most problems, some gaps remain"
-    elif psf >= 40:
-        interpretation["problem_solution_fit"] = "Moderate - Significant alignment work needed"
-    else:
-        interpretation["problem_solution_fit"] = "Weak - Reconsider problem-solution alignment"
-
-    # PMF indicators interpretation
-    pmf = vpc_fit.product_market_fit_indicators
-    if pmf >= 70:
-        interpretation["product_market_indicators"] = "Promising - Strong theoretical indicators for market fit"
-    elif pmf >= 50:
-        interpretation["product_market_indicators"] = "Encouraging - Good foundation, validate with customers"
-    else:
-        interpretation["product_market_indicators"] = "Early stage - More customer discovery needed"
+    interpretation = {
+        "problem_solution_fit": _PSF_MESSAGES[
+            bisect_right(_PSF_THRESHOLDS, vpc_fit.problem_solution_fit)
+        ],
+        "product_market_indicators": _PMF_MESSAGES[
+            bisect_right(_PMF_THRESHOLDS, vpc_fit.product_market_fit_indicators)
+        ],
+    }
 
-    # Coverage interpretation
+    # Coverage combines two scores, so it stays an explicit ladder
     if vpc_fit.pain_coverage >= 80 and vpc_fit.gain_coverage >= 80:
         interpretation["coverage"] = "Comprehensive - Most customer needs are addressed"
     elif vpc_fit.pain_coverage >= 60 or vpc_fit.gain_coverage >= 60:
@@ -299,21 +417,15 @@ def _interpret_fit_scores(vpc_fit: FitScore, bmc_alignment: dict | None) -> dict
     else:
         interpretation["coverage"] = "Limited - Many customer needs not yet addressed"
 
-    # BMC alignment interpretation
     if bmc_alignment:
-        score = bmc_alignment.get("fit_score", 0)
-        if score >= 80:
-            interpretation["business_model_fit"] = "Strong - Business model well-aligned with value proposition"
-        elif score >= 60:
-            interpretation["business_model_fit"] = "Good - Minor alignment adjustments needed"
-        elif score >= 40:
-            interpretation["business_model_fit"] = "Moderate - Business model needs refinement"
-        else:
-            interpretation["business_model_fit"] = "Weak - Significant business model work needed"
+        interpretation["business_model_fit"] = _BM_FIT_MESSAGES[
+            bisect_right(_BM_FIT_THRESHOLDS, bmc_alignment.get("fit_score", 0))
+        ]
 
     return interpretation
 
 
+@_memoized
 def compare_competitors(
     company_name: str,
     your_vpc: dict[str, Any],
@@ -334,11 +446,11 @@ def compare_competitors(
     """
     # Parse your VPC
     try:
-        vpc_input = VPCInput(**your_vpc)
-    except Exception as e:
-        return {"error": f"Invalid VPC data: {str(e)}"}
+        vpc_input = _parse_vpc(your_vpc)
+    except ValidationError as e:
+        return {"error": "Invalid VPC data: " + "; ".join(_error_messages(e))}
 
-    analyzer = CompetitorAnalyzer()
+    analyzer = _COMPETITOR_ANALYZER
 
     # Run analysis
     analysis = analyzer.analyze_competitors(
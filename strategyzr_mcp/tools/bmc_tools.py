@@ -2,14 +2,69 @@
 BMC (Business Model Canvas) tools.
 """
 
+import copy
+import hashlib
+import io
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Any
 
-from ..models.common import ResponseFormat, BusinessStage
+from ..models.common import ResponseFormat, BusinessStage, Recommendation
 from ..models.bmc import BMCInput, BMCOutput
 from ..models.vpc import VPCInput
 from ..validators.quality_scorer import BMCAttractivenessScorer
 from ..validators.fit_analyzer import FitAnalyzer
 
+# Shared instances: the scorer and analyzer are stateless (no instance
+# attributes), so one of each serves every call
+_BMC_SCORER = BMCAttractivenessScorer()
+_FIT_ANALYZER = FitAnalyzer()
+
+# The six possible 0-5 score bars, built once; rendering a row is then a
+# tuple index instead of two string multiplies and a concatenation
+_BARS = tuple("█" * i + "░" * (5 - i) for i in range(6))
+
+# Enum members are singletons, so the format check is an identity test
+_MD = ResponseFormat.MARKDOWN
+
+# Recommendation priority 1-3 mapped to an urgency icon
+_PRIORITY_ICONS = ("🔴", "🟡", "🟢")
+
+# Alignment results keyed by a digest of both canvases; interactive tuning
+# sessions resubmit identical pairs, so bound the cache and evict oldest
+_ALIGNMENT_CACHE: OrderedDict[bytes, dict] = OrderedDict()
+_ALIGNMENT_CACHE_CAP = 128
+
+
+def _aligned_fit(vpc_data: VPCInput, bmc_input: BMCInput) -> dict:
+    """analyze_vpc_bmc_fit memoized by the content of both canvases.
+
+    Results are deep-copied in and out so callers can mutate what they
+    get back without corrupting the cache.
+    """
+    key = hashlib.blake2b(
+        vpc_data.model_dump_json().encode() + b"\x00" + bmc_input.model_dump_json().encode(),
+        digest_size=16,
+    ).digest()
+    cached = _ALIGNMENT_CACHE.get(key)
+    if cached is not None:
+        _ALIGNMENT_CACHE.move_to_end(key)
+        return copy.deepcopy(cached)
+    result = _FIT_ANALYZER.analyze_vpc_bmc_fit(vpc_data, bmc_input)
+    _ALIGNMENT_CACHE[key] = copy.deepcopy(result)
+    if len(_ALIGNMENT_CACHE) > _ALIGNMENT_CACHE_CAP:
+        _ALIGNMENT_CACHE.popitem(last=False)
+    return result
+
+
+@lru_cache(maxsize=128)
+def _pretty(val: str) -> str:
+    """Display form of an enum value ("cost_reduction" -> "Cost Reduction").
+
+    Cached so repeated enum values across rows normalize once.
+    """
+    return val.replace("_", " ").title()
+
 
 def create_bmc(bmc_input: BMCInput, vpc_data: VPCInput | None = None) -> BMCOutput:
     """
@@ -24,7 +79,7 @@ def create_bmc(bmc_input: BMCInput, vpc_data: VPCInput | None = None) -> BMCOutp
         vpc_data: Optional VPC for alignment checking
     """
     # Score and validate
-    scorer = BMCAttractivenessScorer()
+    scorer = _BMC_SCORER
     attractiveness_score = scorer.score(bmc_input)
     validation = scorer.validate(bmc_input)
     recommendations = scorer.generate_recommendations(bmc_input, attractiveness_score)
@@ -32,12 +87,10 @@ def create_bmc(bmc_input: BMCInput, vpc_data: VPCInput | None = None) -> BMCOutp
     # VPC alignment check if provided
     vpc_alignment = None
     if vpc_data:
-        fit_analyzer = FitAnalyzer()
-        vpc_alignment = fit_analyzer.analyze_vpc_bmc_fit(vpc_data, bmc_input)
+        vpc_alignment = _aligned_fit(vpc_data, bmc_input)
 
         # Add alignment-based recommendations
         if vpc_alignment["fit_score"] < 60:
-            from ..models.common import Recommendation
             recommendations.append(Recommendation(
                 priority=1,
                 category="VPC-BMC Alignment",
@@ -47,12 +100,14 @@ def create_bmc(bmc_input: BMCInput, vpc_data: VPCInput | None = None) -> BMCOutp
 
     # Generate markdown output if requested
     markdown_output = None
-    if bmc_input.response_format == ResponseFormat.MARKDOWN:
+    if bmc_input.response_format is _MD:
         markdown_output = _generate_bmc_markdown(
             bmc_input, attractiveness_score, validation, recommendations, vpc_alignment
         )
 
-    return BMCOutput(
+    # Every field below is either straight off the validated BMCInput or
+    # produced by our own scorers; model_construct skips re-validation
+    return BMCOutput.model_construct(
         company_name=bmc_input.company_name,
         industry=bmc_input.industry,
         business_stage=bmc_input.business_stage,
@@ -73,6 +128,106 @@ def create_bmc(bmc_input: BMCInput, vpc_data: VPCInput | None = None) -> BMCOutp
     )
 
 
+# Per-item formatters for the 9 building blocks. Each returns the item's
+# complete markdown lines so the block loop below is one write per item.
+
+def _fmt_segment(segment) -> str:
+    primary = " ⭐" if segment.is_primary else ""
+    size = segment.size_estimate
+    out = f"- **{segment.name}**{primary} ({segment.segment_type})\n  - {segment.description}\n"
+    if size:
+        out += f"  - Size: {size}\n"
+    return out
+
+
+def _fmt_value_prop(vp) -> str:
+    differentiation = vp.differentiation
+    out = f"- **For {vp.target_segment}:** {vp.description}\n  - Type: {vp.value_type}\n"
+    if differentiation:
+        out += f"  - Differentiation: {differentiation}\n"
+    return out
+
+
+def _fmt_channel(channel) -> str:
+    primary = " ⭐" if channel.is_primary else ""
+    return f"- **{channel.name}**{primary} ({channel.channel_type})\n  - Phases: {channel.display_phases}\n"
+
+
+def _fmt_relationship(rel) -> str:
+    description = rel.description
+    out = f"- **{rel.segment}:** {_pretty(rel.relationship_type.value)}\n  - Motivation: {rel.motivation}\n"
+    if description:
+        out += f"  - {description}\n"
+    return out
+
+
+def _fmt_revenue_stream(rev) -> str:
+    recurring = " 🔄" if rev.is_recurring else ""
+    pct = rev.percentage_of_revenue
+    out = (
+        f"- **{rev.name}**{recurring}\n"
+        f"  - From: {rev.source_segment}\n"
+        f"  - Type: {_pretty(rev.revenue_type.value)}\n"
+        f"  - Pricing: {_pretty(rev.pricing_mechanism.value)}\n"
+    )
+    if pct:
+        out += f"  - ~{pct:.0f}% of revenue\n"
+    return out
+
+
+def _fmt_resource(resource) -> str:
+    owned = "owned" if resource.is_owned else "accessed"
+    criticality = resource.criticality
+    return (
+        f"- **{resource.name}** ({resource.resource_type.value}, {owned})\n"
+        f"  - Criticality: {_BARS[criticality]} {criticality}/5\n"
+        f"  - {resource.description}\n"
+    )
+
+
+def _fmt_activity(activity) -> str:
+    return (
+        f"- **{activity.name}** ({_pretty(activity.activity_type.value)})\n"
+        f"  - Frequency: {activity.frequency}\n"
+        f"  - {activity.description}\n"
+    )
+
+
+def _fmt_partnership(partner) -> str:
+    activities = partner.key_activities
+    resources = partner.key_resources
+    out = f"- **{partner.partner_name}** ({partner.partnership_type.replace('_', ' ')})\n  - Motivation: {partner.motivation}\n"
+    if activities:
+        out += f"  - Supports: {', '.join(activities)}\n"
+    if resources:
+        out += f"  - Provides: {', '.join(resources)}\n"
+    return out
+
+
+def _fmt_cost(cost) -> str:
+    key = " 💰" if cost.is_key_cost else ""
+    pct = cost.percentage_of_costs
+    out = f"- **{cost.name}**{key} ({cost.cost_type.value})\n  - {cost.description}\n"
+    if pct:
+        out += f"  - ~{pct:.0f}% of costs\n"
+    return out
+
+
+# (header, BMCInput attribute, item formatter) for each building block,
+# rendered in canonical 9-block order
+_BMC_BLOCKS = (
+    ("\n### Customer Segments\n*Who are the most important customers?*\n\n", "customer_segments", _fmt_segment),
+    ("\n### Value Propositions\n*What value do we deliver?*\n\n", "value_propositions", _fmt_value_prop),
+    ("\n### Channels\n*How do we reach customers?*\n\n", "channels", _fmt_channel),
+    ("\n### Customer Relationships\n*How do we interact with customers?*\n\n", "customer_relationships", _fmt_relationship),
+    ("\n### Revenue Streams\n*How do we make money?*\n\n", "revenue_streams", _fmt_revenue_stream),
+    ("\n### Key Resources\n*What assets do we need?*\n\n", "key_resources", _fmt_resource),
+    ("\n### Key Activities\n*What activities are essential?*\n\n", "key_activities", _fmt_activity),
+    ("\n### Key Partnerships\n*Who are our key partners?*\n\n", "key_partnerships", _fmt_partnership),
+    ("\n### Cost Structure\n*What are our main costs?*\n\n", "cost_structure", _fmt_cost),
+)
+
+
 def _generate_bmc_markdown(
     bmc_input: BMCInput,
     attractiveness_score: Any,
@@ -81,153 +236,89 @@ def _generate_bmc_markdown(
     vpc_alignment: dict | None,
 ) -> str:
     """Generate markdown representation of the BMC."""
-    lines = [
-        f"# Business Model Canvas: {bmc_input.company_name}",
-        f"**Industry:** {bmc_input.industry} | **Stage:** {bmc_input.business_stage.value.title()}",
-        "",
-        "---",
-        "",
-    ]
+    # Single growable buffer instead of a line list plus a final join pass;
+    # binding the write method once keeps each line to a single call
+    buf = io.StringIO()
+    w = buf.write
+
+    w(
+        f"# Business Model Canvas: {bmc_input.company_name}\n"
+        f"**Industry:** {bmc_input.industry} | **Stage:** {bmc_input.business_stage.value.title()}\n"
+        "\n---\n\n"
+    )
 
     # Create the 9-block layout representation
-    lines.extend([
-        "## The 9 Building Blocks",
-        "",
-        "### Customer Segments",
-        "*Who are the most important customers?*",
-        "",
-    ])
-    for segment in bmc_input.customer_segments:
-        primary = " ⭐" if segment.is_primary else ""
-        lines.append(f"- **{segment.name}**{primary} ({segment.segment_type})")
-        lines.append(f"  - {segment.description}")
-        if segment.size_estimate:
-            lines.append(f"  - Size: {segment.size_estimate}")
-
-    lines.extend(["", "### Value Propositions", "*What value do we deliver?*", ""])
-    for vp in bmc_input.value_propositions:
-        lines.append(f"- **For {vp.target_segment}:** {vp.description}")
-        lines.append(f"  - Type: {vp.value_type}")
-        if vp.differentiation:
-            lines.append(f"  - Differentiation: {vp.differentiation}")
-
-    lines.extend(["", "### Channels", "*How do we reach customers?*", ""])
-    for channel in bmc_input.channels:
-        primary = " ⭐" if channel.is_primary else ""
-        phases = ", ".join(p.value for p in channel.phases)
-        lines.append(f"- **{channel.name}**{primary} ({channel.channel_type})")
-        lines.append(f"  - Phases: {phases}")
-
-    lines.extend(["", "### Customer Relationships", "*How do we interact with customers?*", ""])
-    for rel in bmc_input.customer_relationships:
-        lines.append(f"- **{rel.segment}:** {rel.relationship_type.value.replace('_', ' ').title()}")
-        lines.append(f"  - Motivation: {rel.motivation}")
-        if rel.description:
-            lines.append(f"  - {rel.description}")
-
-    lines.extend(["", "### Revenue Streams", "*How do we make money?*", ""])
-    for rev in bmc_input.revenue_streams:
-        recurring = " 🔄" if rev.is_recurring else ""
-        lines.append(f"- **{rev.name}**{recurring}")
-        lines.append(f"  - From: {rev.source_segment}")
-        lines.append(f"  - Type: {rev.revenue_type.value.replace('_', ' ').title()}")
-        lines.append(f"  - Pricing: {rev.pricing_mechanism.value.replace('_', ' ').title()}")
-        if rev.percentage_of_revenue:
-            lines.append(f"  - ~{rev.percentage_of_revenue:.0f}% of revenue")
-
-    lines.extend(["", "### Key Resources", "*What assets do we need?*", ""])
-    for resource in bmc_input.key_resources:
-        owned = "owned" if resource.is_owned else "accessed"
-        lines.append(f"- **{resource.name}** ({resource.resource_type.value}, {owned})")
-        lines.append(f"  - Criticality: {'█' * resource.criticality}{'░' * (5 - resource.criticality)} {resource.criticality}/5")
-        lines.append(f"  - {resource.description}")
-
-    lines.extend(["", "### Key Activities", "*What activities are essential?*", ""])
-    for activity in bmc_input.key_activities:
-        lines.append(f"- **{activity.name}** ({activity.activity_type.value.replace('_', ' ').title()})")
-        lines.append(f"  - Frequency: {activity.frequency}")
-        lines.append(f"  - {activity.description}")
-
-    lines.extend(["", "### Key Partnerships", "*Who are our key partners?*", ""])
-    for partner in bmc_input.key_partnerships:
-        lines.append(f"- **{partner.partner_name}** ({partner.partnership_type.replace('_', ' ')})")
-        lines.append(f"  - Motivation: {partner.motivation}")
-        if partner.key_activities:
-            lines.append(f"  - Supports: {', '.join(partner.key_activities)}")
-        if partner.key_resources:
-            lines.append(f"  - Provides: {', '.join(partner.key_resources)}")
-
-    lines.extend(["", "### Cost Structure", "*What are our main costs?*", ""])
-    for cost in bmc_input.cost_structure:
-        key = " 💰" if cost.is_key_cost else ""
-        lines.append(f"- **{cost.name}**{key} ({cost.cost_type.value})")
-        lines.append(f"  - {cost.description}")
-        if cost.percentage_of_costs:
-            lines.append(f"  - ~{cost.percentage_of_costs:.0f}% of costs")
+    w("## The 9 Building Blocks\n")
+    for header, attr, fmt in _BMC_BLOCKS:
+        w(header)
+        for item in getattr(bmc_input, attr):
+            w(fmt(item))
 
     # Attractiveness Score
-    lines.extend([
-        "",
-        "---",
-        "",
-        "## Business Model Attractiveness",
-        "",
-        f"**Total Score: {attractiveness_score.total_score:.1f} / 35 ({(attractiveness_score.total_score / 35 * 100):.1f}%)**",
-        "",
-        "| Dimension | Score |",
-        "|-----------|-------|",
-        f"| Switching Costs | {'█' * int(attractiveness_score.switching_costs)}{'░' * (5 - int(attractiveness_score.switching_costs))} {attractiveness_score.switching_costs:.1f}/5 |",
-        f"| Recurring Revenues | {'█' * int(attractiveness_score.recurring_revenues)}{'░' * (5 - int(attractiveness_score.recurring_revenues))} {attractiveness_score.recurring_revenues:.1f}/5 |",
-        f"| Earning vs Spending | {'█' * int(attractiveness_score.earning_vs_spending)}{'░' * (5 - int(attractiveness_score.earning_vs_spending))} {attractiveness_score.earning_vs_spending:.1f}/5 |",
-        f"| Cost Structure | {'█' * int(attractiveness_score.cost_structure)}{'░' * (5 - int(attractiveness_score.cost_structure))} {attractiveness_score.cost_structure:.1f}/5 |",
-        f"| Others Do Work | {'█' * int(attractiveness_score.others_do_work)}{'░' * (5 - int(attractiveness_score.others_do_work))} {attractiveness_score.others_do_work:.1f}/5 |",
-        f"| Scalability | {'█' * int(attractiveness_score.scalability)}{'░' * (5 - int(attractiveness_score.scalability))} {attractiveness_score.scalability:.1f}/5 |",
-        f"| Protection | {'█' * int(attractiveness_score.protection)}{'░' * (5 - int(attractiveness_score.protection))} {attractiveness_score.protection:.1f}/5 |",
-    ])
+    w(
+        "\n---\n\n## Business Model Attractiveness\n\n"
+        f"**Total Score: {attractiveness_score.total_score:.1f} / 35 ({(attractiveness_score.total_score / 35 * 100):.1f}%)**\n\n"
+    )
+    # Each dimension is used twice (bar index and display value); read it
+    # off the model once, then emit the whole table in a single write
+    switching = attractiveness_score.switching_costs
+    recurring = attractiveness_score.recurring_revenues
+    earning = attractiveness_score.earning_vs_spending
+    costs = attractiveness_score.cost_structure
+    others = attractiveness_score.others_do_work
+    scalability = attractiveness_score.scalability
+    protection = attractiveness_score.protection
+    w(
+        "| Dimension | Score |\n"
+        "|-----------|-------|\n"
+        f"| Switching Costs | {_BARS[min(int(switching), 5)]} {switching:.1f}/5 |\n"
+        f"| Recurring Revenues | {_BARS[min(int(recurring), 5)]} {recurring:.1f}/5 |\n"
+        f"| Earning vs Spending | {_BARS[min(int(earning), 5)]} {earning:.1f}/5 |\n"
+        f"| Cost Structure | {_BARS[min(int(costs), 5)]} {costs:.1f}/5 |\n"
+        f"| Others Do Work | {_BARS[min(int(others), 5)]} {others:.1f}/5 |\n"
+        f"| Scalability | {_BARS[min(int(scalability), 5)]} {scalability:.1f}/5 |\n"
+        f"| Protection | {_BARS[min(int(protection), 5)]} {protection:.1f}/5 |\n"
+    )
 
     # VPC Alignment if provided
     if vpc_alignment:
-        lines.extend([
-            "",
-            "## VPC-BMC Alignment",
-            "",
-            f"**Alignment Score: {vpc_alignment['fit_score']:.1f}%**",
-            "",
-            "### Strengths",
-        ])
+        w(
+            "\n## VPC-BMC Alignment\n\n"
+            f"**Alignment Score: {vpc_alignment['fit_score']:.1f}%**\n\n"
+            "### Strengths\n"
+        )
         for strength in vpc_alignment.get("alignment_strengths", []):
-            lines.append(f"- ✅ {strength}")
+            w(f"- ✅ {strength}\n")
 
         if vpc_alignment.get("alignment_issues"):
-            lines.extend(["", "### Issues"])
+            w("\n### Issues\n")
             for issue in vpc_alignment["alignment_issues"]:
-                lines.append(f"- ⚠️ {issue}")
+                w(f"- ⚠️ {issue}\n")
 
-        lines.extend(["", f"**Recommendation:** {vpc_alignment.get('recommendation', '')}"])
+        w(f"\n**Recommendation:** {vpc_alignment.get('recommendation', '')}\n")
 
     # Validation
     if validation.warnings or validation.suggestions:
-        lines.extend(["", "## Validation Results", ""])
+        w("\n## Validation Results\n\n")
         if validation.warnings:
-            lines.append("### Warnings")
+            w("### Warnings\n")
             for warning in validation.warnings:
-                lines.append(f"- ⚠️ {warning}")
+                w(f"- ⚠️ {warning}\n")
         if validation.suggestions:
-            lines.append("### Suggestions")
+            w("### Suggestions\n")
             for suggestion in validation.suggestions:
-                lines.append(f"- 💡 {suggestion}")
+                w(f"- 💡 {suggestion}\n")
 
     # Recommendations
     if recommendations:
-        lines.extend(["", "## Recommendations", ""])
+        w("\n## Recommendations\n\n")
         for rec in recommendations:
-            priority_icon = ["🔴", "🟡", "🟢"][rec.priority - 1]
-            lines.append(f"### {priority_icon} {rec.category}")
-            lines.append(f"**{rec.description}**")
-            lines.append(f"*{rec.rationale}*")
-            lines.append("")
+            priority_icon = _PRIORITY_ICONS[rec.priority - 1]
+            w(f"### {priority_icon} {rec.category}\n**{rec.description}**\n*{rec.rationale}*\n\n")
 
-    return "\n".join(lines)
+    # Every write above ends with "\n"; trim the last so the output still
+    # has no newline after the final line
+    return buf.getvalue()[:-1]
 
 
 def get_bmc_template(include_examples: bool = False, include_guidance: bool = True) -> dict[str, Any]:
@@ -238,6 +329,14 @@ def get_bmc_template(include_examples: bool = False, include_guidance: bool = Tr
         include_examples: Whether to include example values
         include_guidance: Whether to include filling guidance
     """
+    # The cached skeleton is shared; hand each caller a private copy so
+    # downstream mutation cannot corrupt it
+    return copy.deepcopy(_build_bmc_template(include_examples, include_guidance))
+
+
+@lru_cache(maxsize=4)
+def _build_bmc_template(include_examples: bool, include_guidance: bool) -> dict[str, Any]:
+    """Construct the template dict once per flag combination."""
     template = {
         "company_name": "",
         "industry": "",
@@ -2,7 +2,10 @@
 VPC (Value Proposition Canvas) tools.
 """
 
+import copy
+import io
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +19,30 @@ from ..models.vpc import (
 from ..validators.quality_scorer import VPCQualityScorer
 from ..validators.fit_analyzer import FitAnalyzer
 
+# Shared instances: the scorer and analyzer are stateless (no instance
+# attributes), so one of each serves every call
+_VPC_SCORER = VPCQualityScorer()
+_FIT_ANALYZER = FitAnalyzer()
+
+# The six possible 0-5 score bars, built once; rendering a row is then a
+# tuple index instead of two string multiplies and a concatenation
+_BARS = tuple("█" * i + "░" * (5 - i) for i in range(6))
+
+# Enum members are singletons, so the format check is an identity test
+_MD = ResponseFormat.MARKDOWN
+
+# Recommendation priority 1-3 mapped to an urgency icon
+_PRIORITY_ICONS = ("🔴", "🟡", "🟢")
+
+
+@lru_cache(maxsize=128)
+def _pretty(val: str) -> str:
+    """Display form of a snake_case key ("pain_coverage" -> "Pain Coverage").
+
+    Cached so repeated values across rows normalize once.
+    """
+    return val.replace("_", " ").title()
+
 
 def create_vpc(vpc_input: VPCInput) -> VPCOutput:
     """
@@ -25,23 +52,24 @@ def create_vpc(vpc_input: VPCInput) -> VPCOutput:
     validates the data, computes fit and quality scores,
     and returns a complete VPC with recommendations.
     """
-    # Build the customer profile
-    customer_profile = CustomerProfile(
+    # Build the customer profile (components were validated with VPCInput;
+    # trusted internal data, skip re-validation)
+    customer_profile = CustomerProfile.model_construct(
         jobs=vpc_input.customer_jobs,
         pains=vpc_input.customer_pains,
         gains=vpc_input.customer_gains,
     )
 
-    # Build the value map
-    value_map = ValueMap(
+    # Build the value map (trusted internal data, skip re-validation)
+    value_map = ValueMap.model_construct(
         products_services=vpc_input.products_services,
         pain_relievers=vpc_input.pain_relievers,
         gain_creators=vpc_input.gain_creators,
     )
 
     # Score and validate
-    scorer = VPCQualityScorer()
-    fit_analyzer = FitAnalyzer()
+    scorer = _VPC_SCORER
+    fit_analyzer = _FIT_ANALYZER
 
     quality_score = scorer.score(vpc_input)
     validation = scorer.validate(vpc_input)
@@ -56,13 +84,15 @@ def create_vpc(vpc_input: VPCInput) -> VPCOutput:
 
     # Generate markdown output if requested
     markdown_output = None
-    if vpc_input.response_format == ResponseFormat.MARKDOWN:
+    if vpc_input.response_format is _MD:
         markdown_output = _generate_vpc_markdown(
             vpc_input, customer_profile, value_map,
             fit_score, quality_score, validation, recommendations
         )
 
-    return VPCOutput(
+    # Every field below came out of our own validators; assembling the
+    # output with model_construct skips a full nested re-validation pass
+    return VPCOutput.model_construct(
         company_name=vpc_input.company_name,
         target_segment=vpc_input.target_segment,
         customer_profile=customer_profile,
@@ -85,36 +115,29 @@ def _generate_vpc_markdown(
     recommendations: list,
 ) -> str:
     """Generate markdown representation of the VPC."""
-    lines = [
-        f"# Value Proposition Canvas: {vpc_input.company_name}",
-        f"**Target Segment:** {vpc_input.target_segment}",
-        "",
-        "---",
-        "",
-        "## Customer Profile",
-        "",
-        "### Customer Jobs",
-    ]
+    # Single growable buffer instead of a line list plus a final join pass;
+    # binding the write method once keeps each line to a single call
+    buf = io.StringIO()
+    w = buf.write
+
+    w(
+        f"# Value Proposition Canvas: {vpc_input.company_name}\n"
+        f"**Target Segment:** {vpc_input.target_segment}\n"
+        "\n---\n\n## Customer Profile\n\n### Customer Jobs\n"
+    )
 
     for job in customer_profile.jobs:
-        lines.append(f"- **{job.job_type.value.title()}** (Importance: {job.importance}/5): {job.description}")
+        w(f"- **{job.job_type.value.title()}** (Importance: {job.importance}/5): {job.description}\n")
 
-    lines.extend(["", "### Customer Pains"])
+    w("\n### Customer Pains\n")
     for pain in customer_profile.pains:
-        lines.append(f"- (Intensity: {pain.intensity}/5, {pain.frequency}): {pain.description}")
+        w(f"- (Intensity: {pain.intensity}/5, {pain.frequency.value}): {pain.description}\n")
 
-    lines.extend(["", "### Customer Gains"])
+    w("\n### Customer Gains\n")
     for gain in customer_profile.gains:
-        lines.append(f"- **{gain.gain_type.value.title()}** (Relevance: {gain.relevance}/5): {gain.description}")
+        w(f"- **{gain.gain_type.value.title()}** (Relevance: {gain.relevance}/5): {gain.description}\n")
 
-    lines.extend([
-        "",
-        "---",
-        "",
-        "## Value Map",
-        "",
-        "### Products & Services",
-    ])
+    w("\n---\n\n## Value Map\n\n### Products & Services\n")
 
     for product in value_map.products_services:
         tags = []
@@ -123,71 +146,59 @@ def _generate_vpc_markdown(
         if not product.is_tangible:
             tags.append("intangible")
         tag_str = f" [{', '.join(tags)}]" if tags else ""
-        lines.append(f"- **{product.name}** (Importance: {product.importance}/5){tag_str}: {product.description}")
+        w(f"- **{product.name}** (Importance: {product.importance}/5){tag_str}: {product.description}\n")
 
-    lines.extend(["", "### Pain Relievers"])
+    w("\n### Pain Relievers\n")
     for reliever in value_map.pain_relievers:
-        lines.append(f"- (Effectiveness: {reliever.effectiveness}/5) {reliever.description}")
-        lines.append(f"  - *Addresses:* {reliever.addresses_pain}")
+        w(f"- (Effectiveness: {reliever.effectiveness}/5) {reliever.description}\n  - *Addresses:* {reliever.addresses_pain}\n")
 
-    lines.extend(["", "### Gain Creators"])
+    w("\n### Gain Creators\n")
     for creator in value_map.gain_creators:
-        lines.append(f"- (Effectiveness: {creator.effectiveness}/5) {creator.description}")
-        lines.append(f"  - *Creates:* {creator.creates_gain}")
+        w(f"- (Effectiveness: {creator.effectiveness}/5) {creator.description}\n  - *Creates:* {creator.creates_gain}\n")
 
     # Fit Score
-    lines.extend([
-        "",
-        "---",
-        "",
-        "## Fit Assessment",
-        "",
-        f"| Metric | Score |",
-        f"|--------|-------|",
-        f"| Problem-Solution Fit | {fit_score.problem_solution_fit:.1f}% |",
-        f"| Product-Market Fit Indicators | {fit_score.product_market_fit_indicators:.1f}% |",
-        f"| Pain Coverage | {fit_score.pain_coverage:.1f}% |",
-        f"| Gain Coverage | {fit_score.gain_coverage:.1f}% |",
-        f"| **Overall Fit** | **{fit_score.overall_fit:.1f}%** |",
-    ])
+    w(
+        "\n---\n\n## Fit Assessment\n\n| Metric | Score |\n|--------|-------|\n"
+        f"| Problem-Solution Fit | {fit_score.problem_solution_fit:.1f}% |\n"
+        f"| Product-Market Fit Indicators | {fit_score.product_market_fit_indicators:.1f}% |\n"
+        f"| Pain Coverage | {fit_score.pain_coverage:.1f}% |\n"
+        f"| Gain Coverage | {fit_score.gain_coverage:.1f}% |\n"
+        f"| **Overall Fit** | **{fit_score.overall_fit:.1f}%** |\n"
+    )
 
     # Quality Score
-    lines.extend([
-        "",
-        "## Quality Assessment (10 Characteristics)",
-        "",
-        f"**Total Score: {quality_score.total_score:.1f} / {quality_score.max_score:.1f} ({quality_score.percentage:.1f}%)**",
-        "",
-    ])
+    w(
+        "\n## Quality Assessment (10 Characteristics)\n\n"
+        f"**Total Score: {quality_score.total_score:.1f} / {quality_score.max_score:.1f} ({quality_score.percentage:.1f}%)**\n\n"
+    )
 
     for criterion, score in quality_score.breakdown.items():
-        criterion_display = criterion.replace("_", " ").title()
-        bar = "█" * int(score) + "░" * (5 - int(score))
-        lines.append(f"- {criterion_display}: {bar} {score:.1f}/5")
+        criterion_display = _pretty(criterion)
+        bar = _BARS[min(int(score), 5)]
+        w(f"- {criterion_display}: {bar} {score:.1f}/5\n")
 
     # Validation
     if validation.warnings or validation.suggestions:
-        lines.extend(["", "## Validation Results", ""])
+        w("\n## Validation Results\n\n")
         if validation.warnings:
-            lines.append("### Warnings")
+            w("### Warnings\n")
             for warning in validation.warnings:
-                lines.append(f"- ⚠️ {warning}")
+                w(f"- ⚠️ {warning}\n")
         if validation.suggestions:
-            lines.append("### Suggestions")
+            w("### Suggestions\n")
             for suggestion in validation.suggestions:
-                lines.append(f"- 💡 {suggestion}")
+                w(f"- 💡 {suggestion}\n")
 
     # Recommendations
     if recommendations:
-        lines.extend(["", "## Recommendations", ""])
+        w("\n## Recommendations\n\n")
         for rec in recommendations:
-            priority_icon = ["🔴", "🟡", "🟢"][rec.priority - 1]
-            lines.append(f"### {priority_icon} {rec.category}")
-            lines.append(f"**{rec.description}**")
-            lines.append(f"*{rec.rationale}*")
-            lines.append("")
+            priority_icon = _PRIORITY_ICONS[rec.priority - 1]
+            w(f"### {priority_icon} {rec.category}\n**{rec.description}**\n*{rec.rationale}*\n\n")
 
-    return "\n".join(lines)
+    # Every write above ends with "\n"; trim the last so the output still
+    # has no newline after the final line
+    return buf.getvalue()[:-1]
 
 
 def get_vpc_template(include_examples: bool = False, include_guidance: bool = True) -> dict[str, Any]:
@@ -198,6 +209,14 @@ def get_vpc_template(include_examples: bool = False, include_guidance: bool = Tr
         include_examples: Whether to include example values
         include_guidance: Whether to include filling guidance
     """
+    # The cached skeleton is shared; hand each caller a private copy so
+    # downstream mutation cannot corrupt it
+    return copy.deepcopy(_build_vpc_template(include_examples, include_guidance))
+
+
+@lru_cache(maxsize=4)
+def _build_vpc_template(include_examples: bool, include_guidance: bool) -> dict[str, Any]:
+    """Construct the template dict once per flag combination."""
     template = {
         "company_name": "",
         "target_segment": "",
@@ -10,7 +10,7 @@ Analyzes:
 from typing import Any
 
 from ..models.common import Recommendation
-from ..models.vpc import VPCInput, FitScore
+from ..models.vpc import VPCInput, FitScore, tokens_match
 from ..models.bmc import BMCInput
 
 
@@ -57,37 +57,38 @@ class FitAnalyzer:
             job_importance_ratio = len(important_jobs) / len(vpc.customer_jobs)
             score += job_importance_ratio * 25
 
-        # Check pain-reliever alignment
+        # Check pain-reliever alignment (same token matcher as gap analysis,
+        # over the token sets cached on the input model)
         if vpc.customer_pains and vpc.pain_relievers:
-            pain_texts = {p.description.lower() for p in vpc.customer_pains}
+            pain_token_sets = vpc.pain_token_sets
             addressed_pains = set()
-            for reliever in vpc.pain_relievers:
+            for reliever_tokens in vpc.reliever_token_sets:
                 # Check if reliever addresses any known pain
-                for pain in pain_texts:
-                    if pain in reliever.addresses_pain.lower() or reliever.addresses_pain.lower() in pain:
-                        addressed_pains.add(pain)
+                for i, pain_tokens in enumerate(pain_token_sets):
+                    if tokens_match(pain_tokens, reliever_tokens):
+                        addressed_pains.add(i)
 
             # Also count high effectiveness relievers
             high_effectiveness = [r for r in vpc.pain_relievers if r.effectiveness >= 4]
             relief_quality = len(high_effectiveness) / len(vpc.pain_relievers) if vpc.pain_relievers else 0
 
-            coverage_score = (len(addressed_pains) / len(pain_texts)) * 20 if pain_texts else 0
+            coverage_score = (len(addressed_pains) / len(pain_token_sets)) * 20 if pain_token_sets else 0
             quality_score = relief_quality * 15
             score += coverage_score + quality_score
 
         # Check gain-creator alignment
         if vpc.customer_gains and vpc.gain_creators:
-            gain_texts = {g.description.lower() for g in vpc.customer_gains}
+            gain_token_sets = vpc.gain_token_sets
             created_gains = set()
-            for creator in vpc.gain_creators:
-                for gain in gain_texts:
-                    if gain in creator.creates_gain.lower() or creator.creates_gain.lower() in gain:
-                        created_gains.add(gain)
+            for creator_tokens in vpc.creator_token_sets:
+                for i, gain_tokens in enumerate(gain_token_sets):
+                    if tokens_match(gain_tokens, creator_tokens):
+                        created_gains.add(i)
 
             high_effectiveness = [c for c in vpc.gain_creators if c.effectiveness >= 4]
             creation_quality = len(high_effectiveness) / len(vpc.gain_creators) if vpc.gain_creators else 0
 
-            coverage_score = (len(created_gains) / len(gain_texts)) * 20 if gain_texts else 0
+            coverage_score = (len(created_gains) / len(gain_token_sets)) * 20 if gain_token_sets else 0
             quality_score = creation_quality * 10
             score += coverage_score + quality_score
 
@@ -142,13 +143,12 @@ class FitAnalyzer:
         if not vpc.customer_pains or not vpc.pain_relievers:
             return 0.0
 
+        # Same token matcher as gap analysis, over the cached token sets
+        reliever_token_sets = vpc.reliever_token_sets
         pains_addressed = 0
-        for pain in vpc.customer_pains:
-            for reliever in vpc.pain_relievers:
-                if (pain.description.lower() in reliever.addresses_pain.lower() or
-                        reliever.addresses_pain.lower() in pain.description.lower()):
-                    pains_addressed += 1
-                    break
+        for pain_tokens in vpc.pain_token_sets:
+            if any(tokens_match(pain_tokens, r) for r in reliever_token_sets):
+                pains_addressed += 1
 
         return (pains_addressed / len(vpc.customer_pains)) * 100
 
@@ -157,13 +157,11 @@ class FitAnalyzer:
         if not vpc.customer_gains or not vpc.gain_creators:
             return 0.0
 
+        creator_token_sets = vpc.creator_token_sets
         gains_created = 0
-        for gain in vpc.customer_gains:
-            for creator in vpc.gain_creators:
-                if (gain.description.lower() in creator.creates_gain.lower() or
-                        creator.creates_gain.lower() in gain.description.lower()):
-                    gains_created += 1
-                    break
+        for gain_tokens in vpc.gain_token_sets:
+            if any(tokens_match(gain_tokens, c) for c in creator_token_sets):
+                gains_created += 1
 
         return (gains_created / len(vpc.customer_gains)) * 100
 
@@ -346,12 +344,15 @@ class CompetitorAnalyzer:
         your_pain_focus = {r.addresses_pain.lower() for r in company_vpc.pain_relievers}
         your_gain_focus = {c.creates_gain.lower() for c in company_vpc.gain_creators}
 
-        # Compare with each competitor
+        # Compare with each competitor; accumulate the union of competitor
+        # pains in the same pass so each string is lowered exactly once
         competitor_overlaps = []
+        all_competitor_pains = set()
         for comp in competitor_vpcs:
             comp_name = comp.get("name", "Competitor")
             comp_pains = set(p.lower() for p in comp.get("pain_relievers", []))
             comp_gains = set(g.lower() for g in comp.get("gain_creators", []))
+            all_competitor_pains |= comp_pains
 
             pain_overlap = len(your_pain_focus & comp_pains)
             gain_overlap = len(your_gain_focus & comp_gains)
@@ -367,9 +368,6 @@ class CompetitorAnalyzer:
         competitor_overlaps.sort(key=lambda x: x["total_overlap"], reverse=True)
 
         # Identify strengths (unique pain relievers)
-        all_competitor_pains = set()
-        for comp in competitor_vpcs:
-            all_competitor_pains.update(p.lower() for p in comp.get("pain_relievers", []))
 
         unique_pains = your_pain_focus - all_competitor_pains
         if unique_pains:
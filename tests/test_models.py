@@ -49,6 +49,14 @@ class TestCommonModels:
         assert score.percentage == 83.3
         assert score.breakdown == breakdown
 
+    def test_quality_score_percentage_rounding(self):
+        """Test percentage keeps one-decimal rounding semantics."""
+        score = QualityScore.create({"a": 1.0, "b": 1.0, "c": 1.0}, max_per_criterion=3.0)
+        assert score.percentage == 33.3
+
+        score = QualityScore.create({"a": 2.5}, max_per_criterion=4.0)
+        assert score.percentage == 62.5
+
     def test_quality_score_empty_breakdown(self):
         """Test QualityScore with empty breakdown."""
         score = QualityScore.create({})
@@ -113,6 +121,16 @@ class TestVPCModels:
                 frequency="invalid"
             )
 
+    def test_customer_pain_non_string_frequency(self):
+        """Test CustomerPain rejects non-string frequency values cleanly."""
+        # Unhashable input must surface as ValidationError, not TypeError
+        with pytest.raises(ValidationError):
+            CustomerPain(
+                description="Tasks fall through cracks",
+                intensity=4,
+                frequency=["often"]
+            )
+
     def test_customer_gain_types(self):
         """Test CustomerGain with different types."""
         for gain_type in GainType:
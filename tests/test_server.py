@@ -125,8 +125,9 @@ class TestVPCTools:
 
     def test_create_vpc_json(self):
         """Test creating VPC with JSON output."""
-        vpc_input = self.create_vpc_input()
-        vpc_input.response_format = ResponseFormat.JSON
+        vpc_input = self.create_vpc_input().model_copy(
+            update={"response_format": ResponseFormat.JSON}
+        )
         result = create_vpc(vpc_input)
 
         assert result.markdown_output is None
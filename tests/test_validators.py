@@ -431,6 +431,30 @@ class TestFitAnalyzer:
         # Sample VPC addresses all pains
         assert fit.pain_coverage > 50
 
+    def test_unrelated_reliever_gives_no_coverage(self):
+        """Test that one shared filler word does not count as coverage."""
+        vpc = create_sample_vpc().model_copy(update={
+            "customer_pains": [
+                CustomerPain(
+                    description="No time to cook dinner",
+                    intensity=4,
+                    frequency="often"
+                ),
+            ],
+            "pain_relievers": [
+                PainReliever(
+                    description="Keeps you on your plan",
+                    addresses_pain="Hard to stick to a workout plan",
+                    effectiveness=4
+                ),
+            ],
+        })
+        analyzer = FitAnalyzer()
+        fit = analyzer.analyze_vpc_fit(vpc)
+
+        # Only "to" is shared between pain and reliever — not a match
+        assert fit.pain_coverage == 0
+
     def test_vpc_bmc_alignment(self):
         """Test VPC-BMC alignment analysis."""
         vpc = create_sample_vpc()